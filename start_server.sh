@@ -9,4 +9,5 @@ fi
 # Start server
 echo "Starting TAU API Server..."
 echo "API docs will be available at http://localhost:8000/docs"
+# Set TAU_LOG=DEBUG for verbose proof-store logging (default: INFO)
 python3 -m tau.server.app
@@ -159,6 +159,17 @@ export class TauClient {
         return new Promise((resolve, reject) => {
             const wsUrl = this.baseUrl.replace('http', 'ws') + '/ws/verify';
             const ws = new WebSocket(wsUrl);
+            ws.binaryType = 'arraybuffer';
+
+            const emitProgress = (data: any) => {
+                onProgress({
+                    stage: data.stage,
+                    message: data.message,
+                    progress: data.progress,
+                    llm_round: data.llm_round,
+                    llm_max_rounds: data.llm_max_rounds
+                });
+            };
 
             ws.onopen = () => {
                 ws.send(JSON.stringify({
@@ -169,16 +180,18 @@ export class TauClient {
             };
 
             ws.onmessage = (event) => {
-                const data = JSON.parse(event.data);
+                // Server sends every message as a binary (orjson-encoded) frame
+                const raw = typeof event.data === 'string'
+                    ? event.data
+                    : new TextDecoder().decode(event.data as ArrayBuffer);
+                const data = JSON.parse(raw);
 
-                if (data.type === 'progress') {
-                    onProgress({
-                        stage: data.stage,
-                        message: data.message,
-                        progress: data.progress,
-                        llm_round: data.llm_round,
-                        llm_max_rounds: data.llm_max_rounds
-                    });
+                if (data.type === 'progress_batch') {
+                    for (const progress of data.events) {
+                        emitProgress(progress);
+                    }
+                } else if (data.type === 'progress') {
+                    emitProgress(data);
                 } else if (data.type === 'result') {
                     ws.close();
                     resolve({
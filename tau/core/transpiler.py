@@ -2,14 +2,93 @@
 Main transpilation pipeline
 """
 
-from typing import Dict, Optional
-from .models import ExternalFunctionContract
+import copy
+import dataclasses
+import functools
+from typing import Any, Dict, List, Optional, Tuple
+from .models import ExternalFunctionContract, FunctionContract
 from ..generators.whyml import generate_whyml_module
 from ..generators.lean import generate_lean_theorems
 from ..utils.files import save_artifacts
 from ..utils.verification import verify_with_why3
 
 
+def _freeze(value: Any) -> Any:
+    """
+    Lossless hashable form of spec data, tagged with each value's type.
+
+    Unlike a JSON dump, tuples stay distinct from lists and int keys from
+    str keys, and dataclasses keep every field. Raises TypeError for
+    values that can't be hashed.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(item) for item in value))
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (type(value), tuple(
+            (field.name, _freeze(getattr(value, field.name))) for field in dataclasses.fields(value)
+        ))
+    hash(value)
+    return (type(value), value)
+
+
+class _Frozen:
+    """Cache key wrapper: compares by _freeze(value), hands the original value through"""
+
+    __slots__ = ("value", "key", "_hash")
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.key = _freeze(value)
+        self._hash = hash(self.key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Frozen) and self.key == other.key
+
+
+@functools.lru_cache(maxsize=256)
+def _generate(python_source: str,
+              function_meta: _Frozen,
+              external_contracts: _Frozen,
+              module_name: Optional[str]) -> Tuple[str, Tuple[FunctionContract, ...], str, str]:
+    """Memoized WhyML + Lean generation, keyed on the frozen specs"""
+    whyml_source, functions, mod_name = generate_whyml_module(
+        python_source,
+        function_meta.value,
+        external_contracts.value,
+        module_name
+    )
+    lean_source = generate_lean_theorems(functions, mod_name)
+    return whyml_source, tuple(functions), mod_name, lean_source
+
+
+def _generate_cached(python_source: str,
+                     function_meta: Dict[str, Dict],
+                     external_contracts: Optional[Dict[str, ExternalFunctionContract]],
+                     module_name: Optional[str]) -> Tuple[str, List[FunctionContract], str, str]:
+    try:
+        meta_key = _Frozen(function_meta)
+        external_key = _Frozen(external_contracts or None)
+    except TypeError:
+        # Specs holding unhashable custom objects can't be keyed; generate directly
+        whyml_source, functions, mod_name = generate_whyml_module(
+            python_source, function_meta, external_contracts, module_name
+        )
+        return whyml_source, functions, mod_name, generate_lean_theorems(functions, mod_name)
+
+    whyml_source, functions, mod_name, lean_source = _generate(
+        python_source, meta_key, external_key, module_name
+    )
+    # Callers own their contracts; the cached ones stay untouched
+    return whyml_source, copy.deepcopy(list(functions)), mod_name, lean_source
+
+
 def transpile(python_source: str,
               function_meta: Dict[str, Dict],
               external_contracts: Optional[Dict[str, ExternalFunctionContract]] = None,
@@ -48,17 +127,15 @@ def transpile(python_source: str,
         ValueError: If no functions found or invalid syntax
         NotImplementedError: If unsupported Python constructs used
     """
-    # Generate WhyML
-    whyml_source, functions, mod_name = generate_whyml_module(
+    # Generate WhyML and Lean (memoized: re-transpiling identical source and
+    # specs, as the feedback loop and editor do, skips parsing and translation)
+    whyml_source, functions, mod_name, lean_source = _generate_cached(
         python_source,
         function_meta,
         external_contracts,
         module_name
     )
 
-    # Generate Lean
-    lean_source = generate_lean_theorems(functions, mod_name)
-
     # Save files
     why_path, lean_path = save_artifacts(whyml_source, lean_source, base_name)
 
@@ -42,8 +42,8 @@ def generate_whyml_module(python_source: str,
     if not function_defs:
         raise ValueError("No functions found in source")
 
-    # Collect function names
-    known_functions = {fn.name for fn in function_defs}
+    # Collect function names once; shared by every function's translator
+    known_functions = frozenset(fn.name for fn in function_defs)
 
     # Translate each function
     functions = []
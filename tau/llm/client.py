@@ -0,0 +1,22 @@
+"""
+Shared Anthropic client construction for the LLM helpers.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+
+
+@functools.lru_cache(maxsize=8)
+def _client_for_key(api_key: str) -> Anthropic:
+    """One client per key, reused (with its connection pool) across calls.
+
+    The SDK takes about a second to import, so it is only imported when
+    the first client is created.
+    """
+    from anthropic import Anthropic
+    return Anthropic(api_key=api_key)
@@ -5,24 +5,26 @@ Requires: anthropic package (optional)
 Install: pip install anthropic
 """
 
+from __future__ import annotations
+
 import ast
+import importlib.util
 import json
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any
 
 from ..core.transpiler import transpile
 from ..core.models import ExternalFunctionContract
-from ..utils.verification import verify_with_why3
+from ..utils.files import unique_base_name
+from ..utils.verification import proof_succeeded, verify_with_why3
+from .client import _client_for_key
+
 
+# Check if anthropic is available. Importing the SDK takes about a second,
+# so it is only imported when the first client is created.
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
 
-# Check if anthropic is available
-try:
+if TYPE_CHECKING:
     from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    # Create stub type for type hints
-    class Anthropic:
-        pass
 
 
 # Prompts
@@ -126,15 +128,13 @@ def _get_client(api_key: Optional[str] = None) -> Optional[Anthropic]:
         return None
 
     try:
-        if api_key:
-            return Anthropic(api_key=api_key)
-
         # Check if env var is actually set before creating client
         # The Anthropic() constructor succeeds even without API key,
         # but will fail on first API call
         import os
-        if 'ANTHROPIC_API_KEY' in os.environ and os.environ['ANTHROPIC_API_KEY']:
-            return Anthropic()
+        api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
+        if api_key:
+            return _client_for_key(api_key)
 
         # No API key available
         return None
@@ -370,7 +370,8 @@ def feedback_loop_transpile(python_source: str,
                             max_rounds: int = 3,
                             external_contracts: Optional[Dict[str, ExternalFunctionContract]] = None,
                             api_key: Optional[str] = None,
-                            verify: bool = True) -> Dict:
+                            verify: bool = True,
+                            on_round: Optional[Callable[[int, int], None]] = None) -> Dict:
     """
     Transpile with LLM-powered feedback loop.
 
@@ -385,6 +386,7 @@ def feedback_loop_transpile(python_source: str,
         external_contracts: Optional external function contracts
         api_key: Optional Anthropic API key
         verify: Whether to run Why3 verification
+        on_round: Optional callback invoked with (round, max_rounds) as each round starts
 
     Returns:
         Dict with:
@@ -456,8 +458,10 @@ def feedback_loop_transpile(python_source: str,
 
     for round_num in range(1, max_rounds + 1):
         print(f"\n🔄 Round {round_num}/{max_rounds}")
+        if on_round:
+            on_round(round_num, max_rounds)
 
-        base_name = f"{target_function}_round{round_num:02d}"
+        base_name = unique_base_name(f"{target_function}_round{round_num:02d}")
 
         # Transpile
         result = transpile(
@@ -475,7 +479,7 @@ def feedback_loop_transpile(python_source: str,
             verification_output = verify_with_why3(result['why_file'], prover="Alt-Ergo,2.6.2", timeout=10)
 
             # Check if verified
-            if "Valid" in verification_output and "Prover result is: Valid" in verification_output:
+            if proof_succeeded(verification_output):
                 verified = True
                 print(f"   ✅ Proof succeeded!")
             else:
@@ -4,6 +4,7 @@ LLM-based specification generator for Python functions
 import os
 from typing import Optional, List
 from tau.server.models import GeneratedSpecs, FunctionInfo
+from tau.llm.client import _client_for_key
 
 
 SPEC_GENERATION_PROMPT = """You are a formal verification expert. Analyze this Python function and generate formal specifications.
@@ -55,15 +56,48 @@ If no loop exists, leave suggested_invariants and suggested_variant empty.
 def _get_client():
     """Get Anthropic client, with graceful fallback"""
     try:
-        import anthropic
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             return None
-        return anthropic.Anthropic(api_key=api_key)
+        return _client_for_key(api_key)
     except ImportError:
         return None
 
 
+def _extract_json(response_text: str) -> str:
+    """Strip markdown fences and trailing prose around a JSON object"""
+    if "```json" in response_text:
+        json_start = response_text.find("```json") + 7
+        json_end = response_text.find("```", json_start)
+        response_text = response_text[json_start:json_end].strip()
+    elif "```" in response_text:
+        json_start = response_text.find("```") + 3
+        json_end = response_text.find("```", json_start)
+        response_text = response_text[json_start:json_end].strip()
+
+    if response_text.strip().startswith('{'):
+        brace_count = 0
+        for i, char in enumerate(response_text):
+            if char == '{':
+                brace_count += 1
+            elif char == '}':
+                brace_count -= 1
+                if brace_count == 0:
+                    return response_text[:i + 1]
+    return response_text
+
+
+def _specs_from_dict(data: dict) -> GeneratedSpecs:
+    return GeneratedSpecs(
+        requires=data.get("requires", ["true"]),
+        ensures=data.get("ensures", ["true"]),
+        reasoning=data.get("reasoning", ""),
+        confidence=float(data.get("confidence", 0.0)),
+        suggested_invariants=data.get("suggested_invariants", []),
+        suggested_variant=data.get("suggested_variant")
+    )
+
+
 async def generate_specifications(
     function_info: FunctionInfo,
     context: str = "",
@@ -110,45 +144,8 @@ async def generate_specifications(
 
         # Parse response
         import json
-        response_text = response.content[0].text
-
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in response_text:
-            json_start = response_text.find("```json") + 7
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-        elif "```" in response_text:
-            json_start = response_text.find("```") + 3
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-
-        # Try to find JSON object boundaries
-        if response_text.strip().startswith('{'):
-            # Find the matching closing brace
-            brace_count = 0
-            json_end_idx = 0
-            for i, char in enumerate(response_text):
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        json_end_idx = i + 1
-                        break
-            if json_end_idx > 0:
-                response_text = response_text[:json_end_idx]
-
-        data = json.loads(response_text)
-
-        # Convert to GeneratedSpecs
-        return GeneratedSpecs(
-            requires=data.get("requires", ["true"]),
-            ensures=data.get("ensures", ["true"]),
-            reasoning=data.get("reasoning", ""),
-            confidence=float(data.get("confidence", 0.0)),
-            suggested_invariants=data.get("suggested_invariants", []),
-            suggested_variant=data.get("suggested_variant")
-        )
+        data = json.loads(_extract_json(response.content[0].text))
+        return _specs_from_dict(data)
 
     except Exception as e:
         print(f"❌ Error generating specifications: {e}")
@@ -201,46 +198,135 @@ def generate_specifications_sync(
 
         # Parse response
         import json
-        response_text = response.content[0].text
-
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in response_text:
-            json_start = response_text.find("```json") + 7
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-        elif "```" in response_text:
-            json_start = response_text.find("```") + 3
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-
-        # Try to find JSON object boundaries
-        if response_text.strip().startswith('{'):
-            # Find the matching closing brace
-            brace_count = 0
-            json_end_idx = 0
-            for i, char in enumerate(response_text):
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        json_end_idx = i + 1
-                        break
-            if json_end_idx > 0:
-                response_text = response_text[:json_end_idx]
-
-        data = json.loads(response_text)
-
-        # Convert to GeneratedSpecs
-        return GeneratedSpecs(
-            requires=data.get("requires", ["true"]),
-            ensures=data.get("ensures", ["true"]),
-            reasoning=data.get("reasoning", ""),
-            confidence=float(data.get("confidence", 0.0)),
-            suggested_invariants=data.get("suggested_invariants", []),
-            suggested_variant=data.get("suggested_variant")
-        )
+        data = json.loads(_extract_json(response.content[0].text))
+        return _specs_from_dict(data)
 
     except Exception as e:
         print(f"❌ Error generating specifications: {e}")
         return None
+
+
+BATCH_SPEC_GENERATION_PROMPT = """You are a formal verification expert. Analyze each of the following Python functions and generate formal specifications for each one independently.
+
+{functions}
+
+Context (surrounding code):
+```python
+{context}
+```
+
+For every function, identify its preconditions (@requires), postconditions (@ensures) and, if it has a loop, suggested loop invariants and a variant.
+
+Use WhyML syntax:
+- Loop variables are references: use !var (e.g., !i, !count)
+- Parameters don't need !: use directly (e.g., n, x)
+- Operators: /\\ (and), \\/ (or), -> (implies), not
+- Math: +, -, *, div, mod
+- Comparisons: =, <>, <, <=, >, >=
+
+Respond with a single JSON object keyed by the function identifiers above, in this exact format:
+{{
+  "index-0": {{
+    "requires": ["precondition1", "precondition2"],
+    "ensures": ["postcondition1", "postcondition2"],
+    "reasoning": "Brief explanation of why these specifications are correct",
+    "confidence": 0.95,
+    "suggested_invariants": ["invariant1", "invariant2"],
+    "suggested_variant": "variant_expression"
+  }}
+}}
+
+If no preconditions are needed, use ["true"].
+If no loop exists, leave suggested_invariants and suggested_variant empty.
+"""
+
+# Functions per batched prompt; keeps responses well inside max_tokens
+SPEC_BATCH_SIZE = 8
+
+# Output-token ceiling of the default model (claude-3-5-haiku)
+MAX_OUTPUT_TOKENS = 8192
+
+
+def generate_specifications_batch_sync(
+    function_infos: List[FunctionInfo],
+    context: str = "",
+    api_key: Optional[str] = None,
+    model: str = "claude-3-5-haiku-20241022",
+    batch_size: int = SPEC_BATCH_SIZE
+) -> List[Optional[GeneratedSpecs]]:
+    """
+    Generate specifications for several functions with one request per batch.
+
+    Functions are grouped up to batch_size per prompt and tagged [index-k];
+    the response is parsed back into one entry per input, in order.
+
+    Args:
+        function_infos: Functions to analyze
+        context: Surrounding code shared by all functions
+        api_key: Anthropic API key (uses env var if not provided)
+        model: Claude model to use
+        batch_size: Maximum functions per request
+
+    Returns:
+        List aligned with function_infos; entries are None where generation failed
+    """
+    if len(function_infos) == 1:
+        return [generate_specifications_sync(function_infos[0], context, api_key, model)]
+
+    results: List[Optional[GeneratedSpecs]] = [None] * len(function_infos)
+    if not function_infos:
+        return results
+
+    if api_key:
+        os.environ["ANTHROPIC_API_KEY"] = api_key
+
+    client = _get_client()
+    if not client:
+        print("⚠️  Warning: Anthropic client not available. Install 'anthropic' package and set ANTHROPIC_API_KEY.")
+        return results
+
+    import json
+
+    for start in range(0, len(function_infos), batch_size):
+        chunk = function_infos[start:start + batch_size]
+        functions = "\n\n".join(
+            f"[index-{k}] {info.name}:\n```python\n{info.source}\n```"
+            for k, info in enumerate(chunk)
+        )
+        prompt = BATCH_SPEC_GENERATION_PROMPT.format(
+            functions=functions,
+            context=context if context else "# No surrounding context provided"
+        )
+
+        try:
+            response = client.messages.create(
+                model=model,
+                max_tokens=min(MAX_OUTPUT_TOKENS, 2000 * len(chunk)),
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }]
+            )
+        except Exception as e:
+            print(f"❌ Error generating specifications: {e}")
+            continue
+
+        try:
+            data = json.loads(_extract_json(response.content[0].text))
+        except (IndexError, AttributeError, ValueError):
+            data = None
+        if not isinstance(data, dict):
+            # Malformed batch response: retry these functions one by one
+            for k, info in enumerate(chunk):
+                results[start + k] = generate_specifications_sync(info, context, api_key, model)
+            continue
+
+        for k in range(len(chunk)):
+            entry = data.get(f"index-{k}")
+            if isinstance(entry, dict):
+                try:
+                    results[start + k] = _specs_from_dict(entry)
+                except (TypeError, ValueError):
+                    pass
+
+    return results
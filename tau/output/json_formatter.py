@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+import orjson
+
 from tau.utils.hashing import ArtifactHasher
 
 
@@ -159,6 +161,8 @@ class VerificationJSONFormatter:
         Returns:
             Formatted JSON string
         """
+        if indent == 2:
+            return orjson.dumps(self.generate(), option=orjson.OPT_INDENT_2).decode('utf-8')
         return json.dumps(self.generate(), indent=indent)
 
     def save_to_file(self, output_path: str, indent: int = 2) -> None:
@@ -170,5 +174,10 @@ class VerificationJSONFormatter:
             indent: Number of spaces for indentation
         """
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if indent == 2:
+            # orjson only indents by 2; it writes UTF-8 bytes directly
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(self.generate(), option=orjson.OPT_INDENT_2))
+            return
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(self.generate(), f, indent=indent)
@@ -8,6 +8,25 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 
+# Fields holding nested statement lists. While is a statement, so loop detection
+# only needs to follow these and can skip every expression subtree.
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def has_while_loop(node: ast.AST) -> bool:
+    """Whether node (a module, function or statement) contains a while loop."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if type(current) is ast.While:
+            return True
+        for field in _BLOCK_FIELDS:
+            block = getattr(current, field, None)
+            if block:
+                stack.extend(block)
+    return False
+
+
 class SafeFunctionParser:
     """Parse Python files to find @safe decorated functions"""
 
@@ -123,7 +142,8 @@ class SafeFunctionParser:
             "invariants": invariants_list if invariants_list else None,
             "variant": variant_value,
             "lineno": node.lineno,
-            "auto_mode": auto_mode  # True if @safe_auto, False if @safe
+            "auto_mode": auto_mode,  # True if @safe_auto, False if @safe
+            "ast": node  # Already-parsed FunctionDef (with decorators); saves re-parsing source
         }
 
     def parse_module(self, module) -> List[Dict[str, Any]]:
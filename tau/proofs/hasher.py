@@ -4,9 +4,65 @@ Computes semantic hashes that are stable across formatting changes.
 """
 
 import ast
+import copy
+import functools
 import hashlib
 import json
-from typing import Dict, Any
+import logging
+from typing import Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _node_components(func_node: ast.FunctionDef) -> Tuple[Tuple[str, ...], str]:
+    return (
+        tuple(arg.arg for arg in func_node.args.args),
+        # Function body (normalized AST dump - ignores whitespace/comments)
+        ast.dump(func_node, annotate_fields=False)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _parsed_components(source: str) -> Tuple[Tuple[str, ...], str]:
+    """Parse + dump keyed on the source text; the same function is hashed repeatedly."""
+    tree = ast.parse(source)
+    return _node_components(tree.body[0])  # Should be a FunctionDef
+
+
+def _body_components(func_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse the function once and return its spec-free semantic components."""
+    func_node = func_info.get("ast")
+    if func_node is None:
+        args, body_ast = _parsed_components(func_info["source"])
+    else:
+        if func_node.decorator_list:
+            # The parser's node still carries the decorators that "source" omits
+            func_node = copy.copy(func_node)
+            func_node.decorator_list = []
+        args, body_ast = _node_components(func_node)
+
+    return {
+        # Function signature
+        "name": func_info["name"],
+        "args": list(args),
+        "body_ast": body_ast
+    }
+
+
+def _spec_components(func_info: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        # Specifications (critical for verification)
+        "requires": func_info.get("requires", ""),
+        "ensures": func_info.get("ensures", ""),
+        "invariants": func_info.get("invariants", []),
+        "variant": func_info.get("variant", "")
+    }
+
+
+def _digest(components: Dict[str, Any]) -> str:
+    # Serialize to canonical JSON (sorted keys for stability)
+    canonical = json.dumps(components, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
 
 
 def compute_function_hash(func_info: Dict[str, Any]) -> str:
@@ -32,40 +88,17 @@ def compute_function_hash(func_info: Dict[str, Any]) -> str:
             - ensures: Postcondition string
             - invariants: List of invariant strings
             - variant: Variant string
+            - ast: Optional FunctionDef already parsed from source (skips re-parsing)
 
     Returns:
         64-character SHA-256 hex digest
     """
     try:
-        # Parse function source to AST
-        tree = ast.parse(func_info["source"])
-        func_node = tree.body[0]  # Should be a FunctionDef
-
-        # Extract semantic components
-        components = {
-            # Function signature
-            "name": func_info["name"],
-            "args": [arg.arg for arg in func_node.args.args],
-
-            # Function body (normalized AST dump - ignores whitespace/comments)
-            "body_ast": ast.dump(func_node, annotate_fields=False),
-
-            # Specifications (critical for verification)
-            "requires": func_info.get("requires", ""),
-            "ensures": func_info.get("ensures", ""),
-            "invariants": func_info.get("invariants", []),
-            "variant": func_info.get("variant", "")
-        }
-
-        # Serialize to canonical JSON (sorted keys for stability)
-        canonical = json.dumps(components, sort_keys=True, separators=(',', ':'))
-
-        # Hash the canonical representation
-        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+        return _digest({**_body_components(func_info), **_spec_components(func_info)})
 
     except Exception as e:
         # Fallback to simple text-based hash if AST parsing fails
-        print(f"Warning: AST-based hashing failed, using fallback: {e}")
+        logger.warning("AST-based hashing failed, using fallback: %s", e)
         return compute_function_hash_simple(func_info)
 
 
@@ -145,28 +178,31 @@ def compute_body_hash(func_info: Dict[str, Any]) -> str:
         64-character SHA-256 hex digest of function body (semantic, no specs)
     """
     try:
-        # Parse function source to AST
-        tree = ast.parse(func_info["source"])
-        func_node = tree.body[0]  # Should be a FunctionDef
-
-        # Extract ONLY semantic body components (NO specs)
-        components = {
-            # Function signature
-            "name": func_info["name"],
-            "args": [arg.arg for arg in func_node.args.args],
-
-            # Function body (normalized AST dump - ignores whitespace/comments)
-            "body_ast": ast.dump(func_node, annotate_fields=False)
-        }
-
-        # Serialize to canonical JSON (sorted keys for stability)
-        canonical = json.dumps(components, sort_keys=True, separators=(',', ':'))
-
-        # Hash the canonical representation
-        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+        # ONLY semantic body components (NO specs)
+        return _digest(_body_components(func_info))
 
     except Exception as e:
         # Fallback to simple text-based hash if AST parsing fails
-        print(f"Warning: AST-based body hashing failed, using fallback: {e}")
+        logger.warning("AST-based body hashing failed, using fallback: %s", e)
         combined = func_info["name"] + func_info["source"]
         return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+
+
+def compute_function_and_body_hash(func_info: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Compute compute_function_hash and compute_body_hash together.
+
+    Both hashes are built from the same AST dump, so storing a proof
+    parses the function once instead of twice. Results are identical to
+    calling the two functions separately.
+
+    Returns:
+        (function hash, body hash) as 64-character SHA-256 hex digests
+    """
+    try:
+        body = _body_components(func_info)
+    except Exception:
+        # Same fallbacks (and warnings) as the individual functions
+        return compute_function_hash(func_info), compute_body_hash(func_info)
+
+    return _digest({**body, **_spec_components(func_info)}), _digest(body)
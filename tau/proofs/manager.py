@@ -2,13 +2,176 @@
 Proof Certificate Manager - handles storage and retrieval of verification results.
 """
 
+import atexit
+import functools
 import json
+import logging
 import os
 import shutil
-from datetime import datetime
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from .hasher import compute_function_hash, compute_body_hash, compute_source_hash
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Union
+
+import orjson
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+from .hasher import (
+    compute_function_hash, compute_body_hash, compute_source_hash, compute_function_and_body_hash
+)
+
+logger = logging.getLogger(__name__)
+
+# Raw certificate artifacts kept in memory so repeated lookups skip the disk
+CERTIFICATE_CACHE_SIZE = 2048
+
+# Current index.json format: files sharded by hash prefix, body index kept
+# in body_index.jsonl. Older stores are migrated once when first opened.
+SCHEMA_VERSION = "3.0.0"
+
+# Frame magic of zstd-compressed artifacts (see read_artifact)
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Lookups only change hit/miss counters and access times; those are written
+# to index.json at most this often (seconds) instead of on every lookup
+ACCESS_FLUSH_INTERVAL = 2.0
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO-8601 string with a trailing 'Z'.
+
+    Formats straight from time.time() so hot paths (batch stores, index
+    saves) don't allocate a datetime object per timestamp.
+    """
+    t = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t)) + f".{int((t % 1) * 1e6):06d}Z"
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    """Write bytes to path atomically (temp file + fsync + os.replace).
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one that would break the next json.load.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _synchronized(method):
+    """Serialize calls to a manager method; the server calls it from worker threads."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _schema_tuple(version: str) -> tuple:
+    """Comparable form of an index schema_version ("2.0.0" -> (2, 0, 0))."""
+    return tuple(int(part) for part in version.split("."))
+
+
+def _iso_to_epoch(timestamp: str) -> float:
+    """Parse an index timestamp ('...Z') back to a UTC epoch."""
+    return datetime.fromisoformat(timestamp.replace("Z", "")).replace(tzinfo=timezone.utc).timestamp()
+
+
+class _EntryColumns:
+    """
+    Column-oriented (struct-of-arrays) mirror of index["entries"].
+
+    The JSON-backed dict stays the on-disk format; this keeps the fields
+    list_proofs needs in parallel columns so listing is a single index
+    sort over a packed float array instead of a dict walk per entry.
+    """
+
+    def __init__(self, entries: Dict[str, Dict[str, Any]]):
+        self.hash: List[str] = []
+        self.function_name: List[str] = []
+        self.verified = array('b')
+        self.created_at: List[str] = []
+        self.created_epoch = array('d')
+        self.last_accessed: List[str] = []
+        self.access_count = array('l')
+        self._pos: Dict[str, int] = {}
+
+        for func_hash, entry in entries.items():
+            self.put(func_hash, entry)
+
+    def put(self, func_hash: str, entry: Dict[str, Any]) -> None:
+        """Insert or overwrite the row for func_hash."""
+        i = self._pos.get(func_hash)
+        if i is None:
+            self._pos[func_hash] = len(self.hash)
+            self.hash.append(func_hash)
+            self.function_name.append(entry["function_name"])
+            self.verified.append(bool(entry["verified"]))
+            self.created_at.append(entry["created_at"])
+            self.created_epoch.append(_iso_to_epoch(entry["created_at"]))
+            self.last_accessed.append(entry["last_accessed"])
+            self.access_count.append(entry.get("access_count", 0))
+            return
+
+        self.function_name[i] = entry["function_name"]
+        self.verified[i] = bool(entry["verified"])
+        self.created_at[i] = entry["created_at"]
+        self.created_epoch[i] = _iso_to_epoch(entry["created_at"])
+        self.last_accessed[i] = entry["last_accessed"]
+        self.access_count[i] = entry.get("access_count", 0)
+
+    def touch(self, func_hash: str, last_accessed: str, access_count: int) -> None:
+        """Record an access for func_hash."""
+        i = self._pos.get(func_hash)
+        if i is not None:
+            self.last_accessed[i] = last_accessed
+            self.access_count[i] = access_count
+
+    def remove(self, func_hash: str) -> None:
+        """Drop the row for func_hash (swap with the last row, then pop)."""
+        i = self._pos.pop(func_hash, None)
+        if i is None:
+            return
+
+        last = len(self.hash) - 1
+        if i != last:
+            for column in (self.hash, self.function_name, self.verified, self.created_at,
+                           self.created_epoch, self.last_accessed, self.access_count):
+                column[i] = column[last]
+            self._pos[self.hash[i]] = i
+
+        for column in (self.hash, self.function_name, self.verified, self.created_at,
+                       self.created_epoch, self.last_accessed, self.access_count):
+            column.pop()
+
+    def newest_first(self) -> List[int]:
+        """Row indices ordered by creation time, newest first."""
+        epochs = self.created_epoch
+        return sorted(range(len(epochs)), key=epochs.__getitem__, reverse=True)
+
+
+# Live managers, flushed by one exit hook; the WeakSet lets them be
+# garbage collected without unregistering anything
+_open_managers: "weakref.WeakSet[ProofCertificateManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers() -> None:
+    for manager in list(_open_managers):
+        manager.flush()
 
 
 class ProofCertificateManager:
@@ -30,10 +193,38 @@ class ProofCertificateManager:
         self.whyml_dir = self.proofs_dir / "whyml"
         self.lean_dir = self.proofs_dir / "lean"
         self.logs_dir = self.proofs_dir / "logs"
+        self.body_index_path = self.proofs_dir / "body_index.jsonl"
+
+        # Bumped on every index write so callers can cheaply tell whether
+        # derived views (stats, listings) are stale
+        self.version = 0
+        # Bumped only when entries are added, replaced or removed (not on
+        # lookups), for views that tolerate slightly stale hit counters
+        self.structure_version = 0
+        self._lock = threading.RLock()
+        self._last_save = 0.0
+        self._access_dirty = False
 
         self._ensure_directories()
         self.config = self._load_config()
+        self._compressor = None
+        if self.config.get("compress_artifacts", False):
+            if ZSTD_AVAILABLE:
+                self._compressor = zstandard.ZstdCompressor(level=3)
+            else:
+                logger.warning("compress_artifacts is enabled but zstandard is not installed; storing plain files")
         self.index = self._load_index()
+        if _schema_tuple(self.index.get("schema_version", "1.0.0")) < _schema_tuple(SCHEMA_VERSION):
+            self._migrate_to_shards()
+        self.body_index = self._load_body_index()
+        self._columns = _EntryColumns(self.index["entries"])
+        # LRU of artifact bytes (hash -> JSON). Its own lock, since
+        # find_proofs_by_body's pool reads it while the caller holds self._lock
+        self._artifact_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._artifact_cache_lock = threading.Lock()
+
+        # Pending access stats are flushed at exit (weakly held, see below)
+        _open_managers.add(self)
 
     def _ensure_directories(self) -> None:
         """Create proof directories if they don't exist."""
@@ -46,47 +237,202 @@ class ProofCertificateManager:
         ]:
             directory.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _shard_path(directory: Path, func_hash: str, suffix: str) -> Path:
+        """Path of a hash-named file inside a two-char prefix shard (git-style)."""
+        return directory / func_hash[:2] / f"{func_hash}{suffix}"
+
+    def _artifact_path(self, func_hash: str) -> Path:
+        return self._shard_path(self.artifacts_dir, func_hash, ".json")
+
+    def _whyml_path(self, func_hash: str) -> Path:
+        return self._shard_path(self.whyml_dir, func_hash, ".mlw")
+
+    def _lean_path(self, func_hash: str) -> Path:
+        return self._shard_path(self.lean_dir, func_hash, ".lean")
+
+    def _log_path(self, func_hash: str) -> Path:
+        return self._shard_path(self.logs_dir, func_hash, ".log")
+
+    def _stored_files(self, func_hash: str) -> List[Path]:
+        """Every file a hash may own, including compressed WhyML/Lean variants."""
+        whyml_path = self._whyml_path(func_hash)
+        lean_path = self._lean_path(func_hash)
+        return [
+            self._artifact_path(func_hash),
+            whyml_path, whyml_path.with_name(whyml_path.name + ".zst"),
+            lean_path, lean_path.with_name(lean_path.name + ".zst"),
+            self._log_path(func_hash)
+        ]
+
+    def _migrate_to_shards(self) -> None:
+        """
+        One-shot migration from the flat layout (artifacts/<hash>.json) to
+        prefix shards (artifacts/ab/<hash>.json), run for indexes older
+        than SCHEMA_VERSION; afterwards the index is stamped with it.
+
+        Keeps large caches from piling tens of thousands of entries into a
+        single directory. Relative paths stored in the index and in the
+        certificates are rewritten to match.
+        """
+        for directory in [self.artifacts_dir, self.whyml_dir, self.lean_dir, self.logs_dir]:
+            for path in list(directory.iterdir()):
+                if path.is_file():
+                    target = self._shard_path(directory, path.stem, path.suffix)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(path, target)
+
+        for func_hash, entry in self.index["entries"].items():
+            artifacts_path = self._artifact_path(func_hash)
+            entry["artifact_file"] = str(artifacts_path.relative_to(self.proofs_dir))
+            if not artifacts_path.exists():
+                continue
+
+            with open(artifacts_path, 'r') as f:
+                certificate = json.load(f)
+            for key, path in [
+                ("whyml_file", self._whyml_path(func_hash)),
+                ("lean_file", self._lean_path(func_hash)),
+                ("log_file", self._log_path(func_hash))
+            ]:
+                if key in certificate:
+                    certificate[key] = str(path.relative_to(self.proofs_dir))
+            with open(artifacts_path, 'w') as f:
+                json.dump(certificate, f, indent=2)
+
+        self.index["layout"] = "sharded"
+        self.index["schema_version"] = SCHEMA_VERSION
+        self._save_index()
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from config.json."""
-        if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
-        return {}
+        try:
+            return orjson.loads(self.config_path.read_bytes())
+        except FileNotFoundError:
+            return {}
 
     def _load_index(self) -> Dict[str, Any]:
         """Load proof index from index.json."""
-        if self.index_path.exists():
-            with open(self.index_path, 'r') as f:
-                index = json.load(f)
-                # Migrate schema if needed (backward compatibility)
-                if "body_index" not in index:
-                    index["body_index"] = {}
-                    index["schema_version"] = "2.0.0"
-                return index
+        try:
+            return orjson.loads(self.index_path.read_bytes())
+        except FileNotFoundError:
+            pass
+        now = _iso_now()
         return {
-            "schema_version": "2.0.0",  # Bumped for body_hash support
-            "created_at": datetime.utcnow().isoformat() + "Z",
-            "last_updated": datetime.utcnow().isoformat() + "Z",
+            "schema_version": SCHEMA_VERSION,
+            "layout": "sharded",  # Files live in <dir>/<hash[:2]>/<hash>.*
+            "created_at": now,
+            "last_updated": now,
             "entries": {},
-            "body_index": {},  # Maps body_hash -> list of full hashes
             "stats": {
                 "total_entries": 0,
                 "cache_hits": 0,
                 "cache_misses": 0,
                 "cache_size_bytes": 0,
-                "last_cleanup": datetime.utcnow().isoformat() + "Z"
+                "last_cleanup": now
             }
         }
 
+    def _load_body_index(self) -> Dict[str, List[str]]:
+        """
+        Load the body index (body_hash -> list of full hashes).
+
+        The body index lives in body_index.jsonl, an append-only log of
+        ["+", body_hash, func_hash] and ["-", body_hash, func_hash] lines,
+        so a store appends one line instead of rewriting it inside
+        index.json. Indexes from before schema 3.0.0 kept it inline; that
+        copy is moved out on first load.
+        """
+        self._body_log_lines = 0
+        self._body_live = 0  # func hashes currently in the body index
+
+        legacy = self.index.pop("body_index", None)
+        if legacy is not None:
+            self.body_index = legacy
+            self.index["schema_version"] = SCHEMA_VERSION
+            self._compact_body_index()
+            self._save_index()
+            return legacy
+
+        body_index: Dict[str, List[str]] = {}
+        try:
+            f = open(self.body_index_path, 'rb')
+        except FileNotFoundError:
+            return body_index
+
+        torn = False
+        with f:
+            for line in f:
+                try:
+                    op, body_hash, func_hash = orjson.loads(line)
+                except (orjson.JSONDecodeError, ValueError):
+                    torn = True  # e.g. a partial final line after a crash
+                    continue
+                self._body_log_lines += 1
+
+                bucket = body_index.setdefault(body_hash, [])
+                if op == "+":
+                    if func_hash not in bucket:
+                        bucket.append(func_hash)
+                elif func_hash in bucket:
+                    bucket.remove(func_hash)
+                if not bucket:
+                    del body_index[body_hash]
+
+        self._body_live = sum(len(func_hashes) for func_hashes in body_index.values())
+        if torn:
+            # Rewrite so later appends don't land on the damaged line
+            self.body_index = body_index
+            self._compact_body_index()
+        return body_index
+
+    def _append_body_log(self, op: str, body_hash: str, func_hash: str) -> None:
+        """Append one add ("+") or tombstone ("-") record to body_index.jsonl."""
+        with open(self.body_index_path, 'ab') as f:
+            f.write(orjson.dumps([op, body_hash, func_hash]) + b"\n")
+        self._body_log_lines += 1
+
+    def _compact_body_index(self) -> None:
+        """Rewrite body_index.jsonl from memory, dropping tombstoned records."""
+        payload = b"".join(
+            orjson.dumps(["+", body_hash, func_hash]) + b"\n"
+            for body_hash, func_hashes in self.body_index.items()
+            for func_hash in func_hashes
+        )
+        _atomic_write(self.body_index_path, payload)
+        self._body_live = sum(len(func_hashes) for func_hashes in self.body_index.values())
+        self._body_log_lines = self._body_live
+
     def _save_index(self) -> None:
         """Save proof index to index.json."""
-        self.index["last_updated"] = datetime.utcnow().isoformat() + "Z"
-        print(f"[ProofManager DEBUG] Saving index to {self.index_path}")
-        print(f"[ProofManager DEBUG] Total entries: {len(self.index['entries'])}")
-        with open(self.index_path, 'w') as f:
-            json.dump(self.index, f, indent=2)
-        print(f"[ProofManager DEBUG] Index saved successfully")
+        self.index["last_updated"] = _iso_now()
+        self.version += 1
+        self._last_save = time.monotonic()
+        self._access_dirty = False
+        logger.debug("Saving index to %s (%d entries)", self.index_path, len(self.index["entries"]))
+        _atomic_write(self.index_path, orjson.dumps(self.index, option=orjson.OPT_INDENT_2))
+
+    def _save_access_stats(self) -> None:
+        """
+        Persist a lookup's stat changes, batched to one index write per interval.
 
+        Rewriting index.json is O(entries); doing it for every cache hit made
+        lookups as expensive as stores. Structural changes (store, invalidate,
+        clear) still save immediately and carry any pending access stats.
+        """
+        self._access_dirty = True
+        if time.monotonic() - self._last_save >= ACCESS_FLUSH_INTERVAL:
+            self._save_index()
+        else:
+            self.version += 1  # In-memory stats changed; derived views are stale
+
+    @_synchronized
+    def flush(self) -> None:
+        """Write any pending access stats to index.json (also runs at exit)."""
+        if self._access_dirty:
+            self._save_index()
+
+    @_synchronized
     def lookup_proof(self, func_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Look up a cached proof certificate for a function.
@@ -103,41 +449,73 @@ class ProofCertificateManager:
         # Check if proof exists in index
         if func_hash not in self.index["entries"]:
             self.index["stats"]["cache_misses"] += 1
-            self._save_index()
+            self._save_access_stats()
             return None
 
         entry = self.index["entries"][func_hash]
 
-        # Validate proof certificate still exists
-        artifacts_path = self.artifacts_dir / f"{func_hash}.json"
-        if not artifacts_path.exists():
-            # Entry exists but artifact is missing - clean up
-            del self.index["entries"][func_hash]
-            self.index["stats"]["total_entries"] -= 1
+        # Load proof certificate (None if the artifact file is gone)
+        certificate = self._load_certificate(func_hash)
+        if certificate is None:
+            # Entry exists but artifact is missing - clean up. The file was
+            # removed outside the manager, so recount the size from disk.
+            self._remove_entry(func_hash)
+            self._update_cache_size()
             self._save_index()
             return None
 
-        # Load and return proof certificate
-        with open(artifacts_path, 'r') as f:
-            certificate = json.load(f)
-
         # Update access time and stats
-        entry["last_accessed"] = datetime.utcnow().isoformat() + "Z"
+        entry["last_accessed"] = _iso_now()
         entry["access_count"] = entry.get("access_count", 0) + 1
+        self._columns.touch(func_hash, entry["last_accessed"], entry["access_count"])
         self.index["stats"]["cache_hits"] += 1
-        self._save_index()
+        self._save_access_stats()
 
         return certificate
 
+    def _load_certificate(self, func_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Certificate for func_hash, or None if its artifact is missing.
+
+        The raw artifact bytes are cached and decoded on every call, so
+        each caller gets its own dict (decoding is cheaper than a deep
+        copy). Misses are not cached; writes drop their hash with
+        _forget_certificate.
+        """
+        with self._artifact_cache_lock:
+            data = self._artifact_cache.get(func_hash)
+            if data is not None:
+                self._artifact_cache.move_to_end(func_hash)
+
+        if data is None:
+            try:
+                data = self._artifact_path(func_hash).read_bytes()
+            except FileNotFoundError:
+                return None
+            with self._artifact_cache_lock:
+                self._artifact_cache[func_hash] = data
+                if len(self._artifact_cache) > CERTIFICATE_CACHE_SIZE:
+                    self._artifact_cache.popitem(last=False)
+
+        return orjson.loads(data)
+
+    def _forget_certificate(self, func_hash: str) -> None:
+        """Drop one hash's cached artifact after it is rewritten or deleted."""
+        with self._artifact_cache_lock:
+            self._artifact_cache.pop(func_hash, None)
+
+    @_synchronized
     def store_proof(
         self,
         func_info: Dict[str, Any],
         verified: bool,
         whyml_code: Optional[str] = None,
         lean_code: Optional[str] = None,
-        why3_output: Optional[str] = None,
+        why3_output: Optional[Union[str, Iterable[str]]] = None,
         reason: Optional[str] = None,
-        duration: Optional[float] = None
+        duration: Optional[float] = None,
+        whyml_path: Optional[Union[str, Path]] = None,
+        lean_path: Optional[Union[str, Path]] = None
     ) -> str:
         """
         Store a proof certificate after verification.
@@ -147,23 +525,30 @@ class ProofCertificateManager:
             verified: Whether verification passed
             whyml_code: Generated WhyML code
             lean_code: Generated Lean code
-            why3_output: Raw Why3 verification output
+            why3_output: Raw Why3 verification output, either as a string or as
+                an iterable of chunks (e.g. lines from a running prover), which
+                is streamed to the log file without being joined in memory
             reason: Failure reason if verification failed
             duration: Verification duration in seconds
+            whyml_path: Existing WhyML file to copy instead of whyml_code
+                (copied file-to-file, never decoded into memory)
+            lean_path: Existing Lean file to copy instead of lean_code
 
         Returns:
             Function hash (proof certificate ID)
         """
-        print(f"[ProofManager DEBUG] store_proof called for {func_info.get('name', 'unknown')}")
-        print(f"[ProofManager DEBUG] verified={verified}, has_whyml={whyml_code is not None}, has_lean={lean_code is not None}")
+        logger.debug(
+            "store_proof called for %s: verified=%s, has_whyml=%s, has_lean=%s",
+            func_info.get("name", "unknown"), verified, whyml_code is not None, lean_code is not None
+        )
 
         # Compute all three hashes for proper auditing
-        func_hash = compute_function_hash(func_info)       # AST-based semantic (cache lookup)
+        # AST-based semantic (cache lookup) and body-only (find similar), one parse
+        func_hash, body_hash = compute_function_and_body_hash(func_info)
         source_hash = compute_source_hash(func_info)       # Exact source (auditing)
-        body_hash = compute_body_hash(func_info)           # AST-based body-only (find similar)
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = _iso_now()
 
-        print(f"[ProofManager DEBUG] Computed hashes - func: {func_hash[:8]}, source: {source_hash[:8]}, body: {body_hash[:8]}")
+        logger.debug("Computed hashes - func: %.8s, source: %.8s, body: %.8s", func_hash, source_hash, body_hash)
 
         # Create proof certificate with full audit trail
         certificate = {
@@ -193,31 +578,37 @@ class ProofCertificateManager:
             }
         }
 
+        # Size of whatever this hash already has on disk (re-store overwrites it)
+        previous_size = self._files_size(func_hash)
+
         # Save WhyML code if provided
-        if whyml_code:
-            whyml_path = self.whyml_dir / f"{func_hash}.mlw"
-            with open(whyml_path, 'w') as f:
-                f.write(whyml_code)
-            certificate["whyml_file"] = str(whyml_path.relative_to(self.proofs_dir))
+        whyml_dest = self._save_artifact(self._whyml_path(func_hash), whyml_code, whyml_path)
+        if whyml_dest:
+            certificate["whyml_file"] = str(whyml_dest.relative_to(self.proofs_dir))
 
         # Save Lean code if provided
-        if lean_code:
-            lean_path = self.lean_dir / f"{func_hash}.lean"
-            with open(lean_path, 'w') as f:
-                f.write(lean_code)
-            certificate["lean_file"] = str(lean_path.relative_to(self.proofs_dir))
+        lean_dest = self._save_artifact(self._lean_path(func_hash), lean_code, lean_path)
+        if lean_dest:
+            certificate["lean_file"] = str(lean_dest.relative_to(self.proofs_dir))
 
         # Save Why3 output log
         if why3_output:
-            log_path = self.logs_dir / f"{func_hash}.log"
-            with open(log_path, 'w') as f:
-                f.write(why3_output)
+            log_path = self._log_path(func_hash)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, 'w', buffering=262144) as f:
+                if isinstance(why3_output, str):
+                    f.write(why3_output)
+                else:
+                    for chunk in why3_output:
+                        f.write(chunk)
             certificate["log_file"] = str(log_path.relative_to(self.proofs_dir))
 
         # Save certificate artifact
-        artifacts_path = self.artifacts_dir / f"{func_hash}.json"
+        artifacts_path = self._artifact_path(func_hash)
+        artifacts_path.parent.mkdir(parents=True, exist_ok=True)
         with open(artifacts_path, 'w') as f:
             json.dump(certificate, f, indent=2)
+        self._forget_certificate(func_hash)
 
         # Update index
         is_new_entry = func_hash not in self.index["entries"]
@@ -231,22 +622,90 @@ class ProofCertificateManager:
             "access_count": 0,
             "artifact_file": str(artifacts_path.relative_to(self.proofs_dir))
         }
+        self._columns.put(func_hash, self.index["entries"][func_hash])
+        self.structure_version += 1
 
         # Update body_index: map body_hash -> list of full hashes
-        if body_hash not in self.index["body_index"]:
-            self.index["body_index"][body_hash] = []
-
-        if func_hash not in self.index["body_index"][body_hash]:
-            self.index["body_index"][body_hash].append(func_hash)
+        bucket = self.body_index.setdefault(body_hash, [])
+        if func_hash not in bucket:
+            bucket.append(func_hash)
+            self._body_live += 1
+            self._append_body_log("+", body_hash, func_hash)
 
         if is_new_entry:
             self.index["stats"]["total_entries"] += 1
+        self.index["stats"]["cache_size_bytes"] += self._files_size(func_hash) - previous_size
 
         self._save_index()
-        self._update_cache_size()
 
         return func_hash
 
+    def _save_artifact(
+        self,
+        dest: Path,
+        code: Optional[str],
+        source_path: Optional[Union[str, Path]]
+    ) -> Optional[Path]:
+        """
+        Write code to dest, or copy source_path there if only a path is given.
+
+        shutil.copyfile lets the kernel copy the file (sendfile /
+        copy_file_range) without a read + UTF-8 decode + encode round trip.
+        With "compress_artifacts" enabled in config.json the file is
+        instead written zstd-compressed as <dest>.zst.
+
+        Returns:
+            Path written if something was saved, None otherwise
+        """
+        if not code and not source_path:
+            return None
+
+        compressed = dest.with_name(dest.name + ".zst")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        if self._compressor is not None:
+            try:
+                data = code.encode('utf-8') if code else Path(source_path).read_bytes()
+            except FileNotFoundError:
+                return None
+            compressed.write_bytes(self._compressor.compress(data))
+            stale, written = dest, compressed
+        elif code:
+            with open(dest, 'w') as f:
+                f.write(code)
+            stale, written = compressed, dest
+        else:
+            try:
+                shutil.copyfile(source_path, dest)
+            except FileNotFoundError:
+                return None
+            stale, written = compressed, dest
+
+        # Drop the other variant left by a store with the opposite setting
+        stale.unlink(missing_ok=True)
+        return written
+
+    def read_artifact(self, relative_path: str) -> Optional[str]:
+        """
+        Read a stored WhyML/Lean/log file named in a certificate.
+
+        Args:
+            relative_path: e.g. certificate["whyml_file"]
+
+        Returns:
+            File text (decompressed if it was stored with zstd), or None if missing
+        """
+        try:
+            data = (self.proofs_dir / relative_path).read_bytes()
+        except FileNotFoundError:
+            return None
+        if data.startswith(ZSTD_MAGIC):
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError(f"{relative_path} is zstd-compressed; install zstandard to read it")
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return data.decode('utf-8')
+
+    @_synchronized
     def invalidate_proof(self, func_hash: str) -> bool:
         """
         Invalidate and delete a proof certificate.
@@ -260,36 +719,47 @@ class ProofCertificateManager:
         if func_hash not in self.index["entries"]:
             return False
 
+        self._remove_entry(func_hash)
+        self._save_index()
+
+        return True
+
+    def _remove_entry(self, func_hash: str) -> None:
+        """
+        Drop an index entry with its files, body index record and size.
+
+        The caller checks the entry exists and saves the index afterwards.
+        """
         # Get body_hash before removing entry
         entry = self.index["entries"][func_hash]
         body_hash = entry.get("body_hash")
 
         # Delete artifact files
-        artifacts_path = self.artifacts_dir / f"{func_hash}.json"
-        whyml_path = self.whyml_dir / f"{func_hash}.mlw"
-        lean_path = self.lean_dir / f"{func_hash}.lean"
-        log_path = self.logs_dir / f"{func_hash}.log"
-
-        for path in [artifacts_path, whyml_path, lean_path, log_path]:
-            if path.exists():
-                path.unlink()
-
-        # Remove from body_index
-        if body_hash and body_hash in self.index["body_index"]:
-            if func_hash in self.index["body_index"][body_hash]:
-                self.index["body_index"][body_hash].remove(func_hash)
+        self.index["stats"]["cache_size_bytes"] -= self._files_size(func_hash)
+        for path in self._stored_files(func_hash):
+            path.unlink(missing_ok=True)
+        self._forget_certificate(func_hash)
+
+        # Remove from body_index (tombstone now, compaction drops it later)
+        if body_hash and body_hash in self.body_index:
+            if func_hash in self.body_index[body_hash]:
+                self.body_index[body_hash].remove(func_hash)
+                self._body_live -= 1
+                self._append_body_log("-", body_hash, func_hash)
             # Clean up empty body_hash entries
-            if not self.index["body_index"][body_hash]:
-                del self.index["body_index"][body_hash]
+            if not self.body_index[body_hash]:
+                del self.body_index[body_hash]
+
+            if self._body_log_lines > 2 * self._body_live + 64:
+                self._compact_body_index()
 
         # Remove from index
         del self.index["entries"][func_hash]
+        self._columns.remove(func_hash)
         self.index["stats"]["total_entries"] -= 1
-        self._save_index()
-        self._update_cache_size()
-
-        return True
+        self.structure_version += 1
 
+    @_synchronized
     def get_stats(self) -> Dict[str, Any]:
         """
         Get proof cache statistics.
@@ -299,6 +769,7 @@ class ProofCertificateManager:
         """
         return self.index["stats"].copy()
 
+    @_synchronized
     def clear_all(self) -> None:
         """Clear all proof certificates (dangerous!)."""
         # Delete all artifacts
@@ -307,19 +778,42 @@ class ProofCertificateManager:
                 shutil.rmtree(directory)
             directory.mkdir(parents=True, exist_ok=True)
 
+        with self._artifact_cache_lock:
+            self._artifact_cache.clear()
+
         # Reset index
         self.index["entries"] = {}
+        self.body_index = {}
+        self._compact_body_index()
+        self._columns = _EntryColumns({})
+        self.structure_version += 1
         self.index["stats"] = {
             "total_entries": 0,
             "cache_hits": 0,
             "cache_misses": 0,
             "cache_size_bytes": 0,
-            "last_cleanup": datetime.utcnow().isoformat() + "Z"
+            "last_cleanup": _iso_now()
         }
         self._save_index()
 
+    def _files_size(self, func_hash: str) -> int:
+        """Total bytes on disk for one hash's artifact/WhyML/Lean/log files."""
+        total_size = 0
+        for path in self._stored_files(func_hash):
+            try:
+                total_size += path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return total_size
+
     def _update_cache_size(self) -> None:
-        """Update cache size statistics."""
+        """
+        Recount cache_size_bytes from disk.
+
+        store_proof/invalidate_proof keep the counter up to date
+        incrementally; this full walk only runs during cleanup, to
+        correct any drift from files changed outside the manager.
+        """
         total_size = 0
         for directory in [self.artifacts_dir, self.whyml_dir, self.lean_dir, self.logs_dir]:
             if directory.exists():
@@ -328,8 +822,8 @@ class ProofCertificateManager:
                         total_size += path.stat().st_size
 
         self.index["stats"]["cache_size_bytes"] = total_size
-        self._save_index()
 
+    @_synchronized
     def cleanup_old_proofs(self, max_age_days: Optional[int] = None) -> int:
         """
         Clean up old proof certificates based on age.
@@ -343,7 +837,6 @@ class ProofCertificateManager:
         if max_age_days is None:
             max_age_days = self.config.get("max_age_days", 365)
 
-        from datetime import timedelta
         cutoff = datetime.utcnow() - timedelta(days=max_age_days)
 
         deleted = 0
@@ -358,11 +851,43 @@ class ProofCertificateManager:
             if self.invalidate_proof(func_hash):
                 deleted += 1
 
-        self.index["stats"]["last_cleanup"] = datetime.utcnow().isoformat() + "Z"
+        self._update_cache_size()
+        self.index["stats"]["last_cleanup"] = _iso_now()
         self._save_index()
 
         return deleted
 
+    def iter_proofs(self, verified_only: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Yield proof certificate summaries one at a time, newest first.
+
+        Rows are snapshotted from the columns under the lock, but the
+        summary dicts are built lazily, so a streaming caller never holds
+        the whole list at once.
+
+        Args:
+            verified_only: Only yield verified proofs
+        """
+        with self._lock:
+            cols = self._columns
+            verified = cols.verified
+            rows = [
+                (cols.hash[i], cols.function_name[i], bool(verified[i]),
+                 cols.created_at[i], cols.last_accessed[i], cols.access_count[i])
+                for i in cols.newest_first()
+                if verified[i] or not verified_only
+            ]
+
+        for func_hash, function_name, is_verified, created_at, last_accessed, access_count in rows:
+            yield {
+                "hash": func_hash,
+                "function_name": function_name,
+                "verified": is_verified,
+                "created_at": created_at,
+                "last_accessed": last_accessed,
+                "access_count": access_count
+            }
+
     def list_proofs(self, verified_only: bool = False) -> List[Dict[str, Any]]:
         """
         List all proof certificates.
@@ -373,22 +898,9 @@ class ProofCertificateManager:
         Returns:
             List of proof certificate summaries
         """
-        results = []
-        for func_hash, entry in self.index["entries"].items():
-            if verified_only and not entry["verified"]:
-                continue
-
-            results.append({
-                "hash": func_hash,
-                "function_name": entry["function_name"],
-                "verified": entry["verified"],
-                "created_at": entry["created_at"],
-                "last_accessed": entry["last_accessed"],
-                "access_count": entry["access_count"]
-            })
-
-        return sorted(results, key=lambda x: x["created_at"], reverse=True)
+        return list(self.iter_proofs(verified_only=verified_only))
 
+    @_synchronized
     def find_proofs_by_body(self, func_info: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Find all cached proofs for the same function body (ignoring specs).
@@ -406,23 +918,25 @@ class ProofCertificateManager:
         body_hash = compute_body_hash(func_info)
 
         # Check if this body hash exists
-        if body_hash not in self.index["body_index"]:
+        if body_hash not in self.body_index:
             return []
 
         # Get all full hashes for this body
-        full_hashes = self.index["body_index"][body_hash]
+        full_hashes = self.body_index[body_hash]
+
+        # Load certificates for each hash; the reads are independent and
+        # IO-bound, so a bucket with several specs loads them concurrently
+        if len(full_hashes) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(full_hashes))) as executor:
+                certificates = list(executor.map(self._load_certificate, full_hashes))
+        else:
+            certificates = [self._load_certificate(h) for h in full_hashes]
 
-        # Load certificates for each hash
         results = []
-        for func_hash in full_hashes:
-            # Load certificate
-            artifacts_path = self.artifacts_dir / f"{func_hash}.json"
-            if not artifacts_path.exists():
+        for func_hash, certificate in zip(full_hashes, certificates):
+            if certificate is None:
                 continue
 
-            with open(artifacts_path, 'r') as f:
-                certificate = json.load(f)
-
             # Get index entry for metadata
             if func_hash in self.index["entries"]:
                 entry = self.index["entries"][func_hash]
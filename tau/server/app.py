@@ -4,25 +4,37 @@ TAU FastAPI Server
 Provides REST API for specification generation and verification
 """
 import os
-import json
+import time
+import logging
 import asyncio
-from typing import Optional, List
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, Optional, List
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 
 from tau.server.client import TauClient
 from tau.server.models import GeneratedSpecs, VerificationProgress, ValidationResult
 from tau.proofs import ProofCertificateManager, compute_function_hash
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Request/Response Models
 # ============================================================================
 
-class GenerateSpecsRequest(BaseModel):
+class RequestModel(BaseModel):
+    # Requests are immutable: coalesced requests share one work closure
+    model_config = ConfigDict(frozen=True)
+
+
+class GenerateSpecsRequest(RequestModel):
     function_source: str
     context: Optional[str] = ""
     include_invariants: bool = True
@@ -34,14 +46,20 @@ class GenerateSpecsResponse(BaseModel):
     error: Optional[str] = None
 
 
-class VerifyFunctionRequest(BaseModel):
+class VerifyFunctionRequest(RequestModel):
     file_path: str
     function_name: str
     auto_generate_invariants: bool = True
 
 
-class VerifyFileRequest(BaseModel):
+class VerifyFileRequest(RequestModel):
+    file_path: str
+
+
+class WsVerifyRequest(RequestModel):
+    action: str
     file_path: str
+    function_name: Optional[str] = None
 
 
 class VerificationResponse(BaseModel):
@@ -50,7 +68,7 @@ class VerificationResponse(BaseModel):
     error: Optional[str] = None
 
 
-class ValidateSpecsRequest(BaseModel):
+class ValidateSpecsRequest(RequestModel):
     requires: str
     ensures: str
     function_source: str
@@ -68,7 +86,7 @@ class HealthResponse(BaseModel):
     anthropic_available: bool
 
 
-class CheckProofRequest(BaseModel):
+class CheckProofRequest(RequestModel):
     function_name: str
     function_source: str
     requires: Optional[str] = ""
@@ -87,7 +105,7 @@ class CheckProofResponse(BaseModel):
     specs: Optional[dict] = None
 
 
-class StoreProofRequest(BaseModel):
+class StoreProofRequest(RequestModel):
     function_name: str
     function_source: str
     requires: Optional[str] = ""
@@ -116,14 +134,43 @@ class ProofStatsResponse(BaseModel):
     last_cleanup: str
 
 
+class ProofBatchOperation(RequestModel):
+    op: str  # "check", "by-body", "store", "stats" or "list"
+    body: Dict[str, Any] = {}
+
+
+class ProofBatchRequest(RequestModel):
+    requests: List[ProofBatchOperation]
+
+
 # ============================================================================
 # FastAPI App
 # ============================================================================
 
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (bytes out, no stdlib json pass)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the client and proof manager before accepting traffic."""
+    global tau_client, proof_manager
+    # Loading the index (and any migration) is disk I/O; keep it off the loop
+    proof_manager = await asyncio.to_thread(ProofCertificateManager)
+    tau_client = TauClient(api_key=os.getenv("ANTHROPIC_API_KEY"), proof_manager=proof_manager)
+    yield
+    await asyncio.to_thread(proof_manager.flush)
+
+
 app = FastAPI(
     title="TAU API",
     description="Formal verification API for Python with Claude AI",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Enable CORS for VS Code extension
@@ -141,35 +188,88 @@ proof_manager: Optional[ProofCertificateManager] = None
 
 
 def get_tau_client() -> TauClient:
-    """Get or create TAU client instance"""
+    """Get TAU client instance (created in lifespan; lazily if run without it)"""
     global tau_client
     if tau_client is None:
         api_key = os.getenv("ANTHROPIC_API_KEY")
-        tau_client = TauClient(api_key=api_key)
+        tau_client = TauClient(api_key=api_key, proof_manager=get_proof_manager())
     return tau_client
 
 
 def get_proof_manager() -> ProofCertificateManager:
-    """Get or create proof certificate manager instance"""
+    """Get proof certificate manager instance (created in lifespan; lazily if run without it)"""
     global proof_manager
     if proof_manager is None:
         proof_manager = ProofCertificateManager()
     return proof_manager
 
 
+# Short-lived cache for the read-only proof endpoints. Entries are keyed on
+# the manager's structure version, so a store/invalidate/clear drops them;
+# lookups only move hit counters, whose staleness the TTL bounds (as it does
+# for other processes sharing the proofs/ dir).
+PROOF_RESPONSE_TTL = 5.0
+_proof_responses: Dict[tuple, tuple] = {}
+_proof_responses_version = -1
+
+
+async def cached_proof_response(key: tuple, build: Callable[[], Any]) -> Any:
+    """Return build() for key, reusing a result from the last few seconds"""
+    global _proof_responses_version
+    version = get_proof_manager().structure_version
+    if version != _proof_responses_version:
+        _proof_responses.clear()
+        _proof_responses_version = version
+
+    cached = _proof_responses.get(key)
+    if cached is not None and time.monotonic() - cached[0] < PROOF_RESPONSE_TTL:
+        return cached[1]
+
+    # build() takes the manager lock, so it runs off the event loop; callers
+    # missing at the same time share one build
+    value = await coalesce(("proof-response",) + key, lambda: asyncio.to_thread(build))
+    if _proof_responses_version == version:
+        _proof_responses[key] = (time.monotonic(), value)
+    return value
+
+
+# In-flight work shared between identical concurrent requests
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+async def coalesce(key: tuple, work: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run work() once for all concurrent callers with the same key.
+
+    A duplicate request arriving while the first is still running awaits
+    the same task instead of starting another verifier/LLM call. The task
+    is shielded so one client disconnecting doesn't cancel it for others.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(work())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
 
-@app.get("/", response_model=HealthResponse)
+# The health payload never changes for the life of the process, so it is
+# serialized once; load balancers polling "/" get the bytes as-is
+_HEALTH_BYTES = orjson.dumps({
+    "status": "ok",
+    "version": "0.1.0",
+    "anthropic_available": bool(os.getenv("ANTHROPIC_API_KEY"))
+})
+
+
+@app.get("/", response_model=None, responses={200: {"model": HealthResponse}})
 async def health():
     """Health check endpoint"""
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    return {
-        "status": "ok",
-        "version": "0.1.0",
-        "anthropic_available": bool(api_key)
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.post("/api/generate-specs", response_model=GenerateSpecsResponse)
@@ -187,10 +287,14 @@ async def generate_specs(request: GenerateSpecsRequest):
     """
     try:
         client = get_tau_client()
-        specs = client.generate_specs(
-            function_source=request.function_source,
-            context=request.context,
-            include_invariants=request.include_invariants
+        specs = await coalesce(
+            ("generate_specs", request.function_source, request.context, request.include_invariants),
+            lambda: asyncio.to_thread(
+                client.generate_specs,
+                function_source=request.function_source,
+                context=request.context,
+                include_invariants=request.include_invariants
+            )
         )
 
         if specs is None:
@@ -211,7 +315,11 @@ async def generate_specs(request: GenerateSpecsRequest):
         }
 
 
-@app.post("/api/verify-function", response_model=VerificationResponse)
+@app.post(
+    "/api/verify-function",
+    response_model=None,
+    responses={200: {"model": VerificationResponse}}
+)
 async def verify_function(request: VerifyFunctionRequest):
     """
     Verify a single function in a file.
@@ -231,66 +339,25 @@ async def verify_function(request: VerifyFunctionRequest):
         if not Path(request.file_path).exists():
             raise HTTPException(status_code=404, detail="File not found")
 
-        result = client.verify_function(
-            file_path=request.file_path,
-            function_name=request.function_name,
-            auto_generate_invariants=request.auto_generate_invariants
+        # The client's proof manager stores the certificate after verification
+        async def run_verification():
+            return await asyncio.to_thread(
+                client.verify_function,
+                file_path=request.file_path,
+                function_name=request.function_name,
+                auto_generate_invariants=request.auto_generate_invariants
+            )
+
+        result = await coalesce(
+            ("verify_function", request.file_path, request.function_name, request.auto_generate_invariants),
+            run_verification
         )
 
         if result is None:
-            return {
+            return ORJSONResponse({
                 "success": False,
                 "error": f"Function '{request.function_name}' not found"
-            }
-
-        # Automatically store proof after verification
-        print(f"[ProofStore DEBUG] result={result}, has_hash={result.hash if result else 'N/A'}")
-        if result and result.hash:
-            try:
-                manager = get_proof_manager()
-
-                # Read proof artifacts if available
-                whyml_code = None
-                lean_code = None
-
-                print(f"[ProofStore DEBUG] whyml_file={result.whyml_file}, lean_file={result.lean_file}")
-
-                if result.whyml_file and Path(result.whyml_file).exists():
-                    whyml_code = Path(result.whyml_file).read_text()
-                    print(f"[ProofStore DEBUG] Loaded whyml_code: {len(whyml_code)} chars")
-
-                if result.lean_file and Path(result.lean_file).exists():
-                    lean_code = Path(result.lean_file).read_text()
-                    print(f"[ProofStore DEBUG] Loaded lean_code: {len(lean_code)} chars")
-
-                # Prepare function info for storage
-                print(f"[ProofStore DEBUG] python_source length: {len(result.python_source) if result.python_source else 0}")
-                func_info = {
-                    "name": result.name,
-                    "source": result.python_source,
-                    "requires": result.specification.get("requires", ""),
-                    "ensures": result.specification.get("ensures", ""),
-                    "invariants": result.specification.get("invariants", []),
-                    "variant": result.specification.get("variant", "")
-                }
-
-                print(f"[ProofStore DEBUG] About to call store_proof for {result.name}")
-                # Store proof certificate
-                stored_hash = manager.store_proof(
-                    func_info=func_info,
-                    verified=result.verified,
-                    whyml_code=whyml_code,
-                    lean_code=lean_code,
-                    why3_output=None,
-                    reason=result.reason,
-                    duration=result.duration
-                )
-
-                print(f"[ProofStore] Stored proof for {result.name} - hash: {stored_hash[:8]}, verified: {result.verified}")
-            except Exception as e:
-                import traceback
-                print(f"[ProofStore] Failed to store proof: {e}")
-                print(f"[ProofStore] Traceback: {traceback.format_exc()}")
+            })
 
         # Convert result to dict
         result_dict = {
@@ -305,19 +372,23 @@ async def verify_function(request: VerifyFunctionRequest):
             "hash": result.hash or ""
         }
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "result": result_dict
-        }
+        })
 
     except Exception as e:
-        return {
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
-        }
+        })
 
 
-@app.post("/api/verify-file", response_model=VerificationResponse)
+@app.post(
+    "/api/verify-file",
+    response_model=None,
+    responses={200: {"model": VerificationResponse}}
+)
 async def verify_file(request: VerifyFileRequest):
     """
     Verify all @safe functions in a file.
@@ -335,7 +406,7 @@ async def verify_file(request: VerifyFileRequest):
         if not Path(request.file_path).exists():
             raise HTTPException(status_code=404, detail="File not found")
 
-        summary = client.verify_file(file_path=request.file_path)
+        summary = await asyncio.to_thread(client.verify_file, file_path=request.file_path)
 
         # Convert results to dict
         results = []
@@ -351,7 +422,9 @@ async def verify_file(request: VerifyFileRequest):
                 "hash": result.hash or ""
             })
 
-        return {
+        # Return the response directly: the nested results list skips
+        # response_model re-validation and goes straight to orjson
+        return ORJSONResponse({
             "success": True,
             "result": {
                 "total": summary.total,
@@ -359,13 +432,13 @@ async def verify_file(request: VerifyFileRequest):
                 "failed": summary.failed,
                 "results": results
             }
-        }
+        })
 
     except Exception as e:
-        return {
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
-        }
+        })
 
 
 @app.post("/api/validate-specs", response_model=ValidateSpecsResponse)
@@ -383,7 +456,8 @@ async def validate_specs(request: ValidateSpecsRequest):
     """
     try:
         client = get_tau_client()
-        result = client.validate_specs(
+        result = await asyncio.to_thread(
+            client.validate_specs,
             requires=request.requires,
             ensures=request.ensures,
             function_source=request.function_source
@@ -429,7 +503,11 @@ async def check_proof(request: CheckProofRequest):
             "variant": request.variant
         }
 
-        certificate = manager.lookup_proof(func_info)
+        certificate = await coalesce(
+            ("check_proof", request.function_name, request.function_source, request.requires,
+             request.ensures, tuple(request.invariants or ()), request.variant),
+            lambda: asyncio.to_thread(manager.lookup_proof, func_info)
+        )
 
         if certificate:
             return {
@@ -488,7 +566,7 @@ async def find_proofs_by_body(request: CheckProofRequest):
             # Note: NOT including specs - we want to find by body only
         }
 
-        proofs = manager.find_proofs_by_body(func_info)
+        proofs = await asyncio.to_thread(manager.find_proofs_by_body, func_info)
 
         return {
             "found": len(proofs) > 0,
@@ -541,7 +619,8 @@ async def store_proof(request: StoreProofRequest):
             "variant": request.variant
         }
 
-        func_hash = manager.store_proof(
+        func_hash = await asyncio.to_thread(
+            manager.store_proof,
             func_info=func_info,
             verified=request.verified,
             whyml_code=request.whyml_code,
@@ -573,8 +652,7 @@ async def get_proof_stats():
         GET /api/proofs/stats
     """
     try:
-        manager = get_proof_manager()
-        stats = manager.get_stats()
+        stats = await cached_proof_response(("stats",), get_proof_manager().get_stats)
 
         return {
             "total_entries": stats["total_entries"],
@@ -598,7 +676,7 @@ async def clear_proofs():
     """
     try:
         manager = get_proof_manager()
-        manager.clear_all()
+        await asyncio.to_thread(manager.clear_all)
 
         return {"success": True, "message": "All proofs cleared"}
 
@@ -606,28 +684,251 @@ async def clear_proofs():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _ndjson(items: Iterable[dict]) -> Iterator[bytes]:
+    """Encode items as newline-delimited JSON, one line per item."""
+    for item in items:
+        yield orjson.dumps(item) + b"\n"
+
+
+async def _list_proofs_json(verified_only: bool = False) -> dict:
+    """Buffered body of /api/proofs/list (the default, non-streaming form)."""
+    manager = get_proof_manager()
+    proofs = await cached_proof_response(
+        ("list", verified_only),
+        lambda: manager.list_proofs(verified_only=verified_only)
+    )
+    return {"success": True, "proofs": proofs}
+
+
 @app.get("/api/proofs/list")
-async def list_proofs(verified_only: bool = False):
+async def list_proofs(request: Request, verified_only: bool = False, format: Optional[str] = None):
     """
     List all proof certificates.
 
+    Returns {"success": true, "proofs": [...]} by default. Clients that
+    pass format=ndjson, or send Accept: application/x-ndjson, get one
+    proof summary per line as a stream instead, so large caches start
+    arriving immediately.
+
     Example:
         GET /api/proofs/list?verified_only=true
+        GET /api/proofs/list?format=ndjson
     """
     try:
         manager = get_proof_manager()
-        proofs = manager.list_proofs(verified_only=verified_only)
 
-        return {"success": True, "proofs": proofs}
+        if format is None:
+            streaming = "application/x-ndjson" in request.headers.get("accept", "")
+        else:
+            streaming = format == "ndjson"
+
+        if not streaming:
+            return ORJSONResponse(await _list_proofs_json(verified_only))
+
+        return StreamingResponse(
+            _ndjson(manager.iter_proofs(verified_only=verified_only)),
+            media_type="application/x-ndjson"
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Batch op name -> handler taking the op's body; responses match the endpoints
+_PROOF_BATCH_OPS: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]] = {
+    "check": lambda body: check_proof(CheckProofRequest(**body)),
+    "by-body": lambda body: find_proofs_by_body(CheckProofRequest(**body)),
+    "store": lambda body: store_proof(StoreProofRequest(**body)),
+    "stats": lambda body: get_proof_stats(),
+    "list": lambda body: _list_proofs_json(bool(body.get("verified_only", False))),
+}
+
+
+@app.post("/api/proofs/batch")
+async def proof_batch(request: ProofBatchRequest):
+    """
+    Run several proof cache operations in one request.
+
+    Operations run in order, so a "check" sees an earlier "store". Each
+    entry of "responses" is what the operation's own endpoint returns;
+    a failing operation gives {"error": ...} and the rest still run.
+
+    Example:
+        POST /api/proofs/batch
+        {
+            "requests": [
+                {"op": "store", "body": {"function_name": "count_to", ...}},
+                {"op": "check", "body": {"function_name": "count_to", ...}},
+                {"op": "stats"}
+            ]
+        }
+    """
+    responses = []
+    for operation in request.requests:
+        handler = _PROOF_BATCH_OPS.get(operation.op)
+        if handler is None:
+            responses.append({"error": f"Unknown operation: {operation.op}"})
+            continue
+        try:
+            responses.append(await handler(operation.body))
+        except HTTPException as e:
+            responses.append({"error": e.detail})
+        except Exception as e:
+            responses.append({"error": str(e)})
+
+    return {"success": True, "responses": responses}
+
+
 # ============================================================================
 # WebSocket for Streaming Progress
 # ============================================================================
 
+class ProgressBatcher:
+    """
+    Coalesces progress events into one WebSocket frame per time window.
+
+    Fast verifiers emit many small progress events; instead of one
+    JSON encode and one frame each, events are buffered and sent as a
+    single {"type": "progress_batch", "events": [...]} frame. Only the
+    latest event per stage is kept within a window, so a burst of
+    updates to one stage costs one entry.
+    """
+
+    def __init__(self, websocket: WebSocket, window: float = 0.05):
+        self.websocket = websocket
+        self.window = window
+        self.pending: Dict[str, dict] = {}
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        # Verifier threads add events directly under this lock; the loop is
+        # only woken once per window to arm the flush timer
+        self._lock = threading.Lock()
+        self._armed = False
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, event: dict) -> None:
+        """Queue an event, replacing any queued one for the same stage."""
+        with self._lock:
+            self.pending.pop(event["stage"], None)  # re-insert so order follows latest
+            self.pending[event["stage"]] = event
+            if self._armed:
+                return
+            self._armed = True
+
+        if threading.get_ident() == self._loop_thread:
+            self._arm()
+        else:
+            self._loop.call_soon_threadsafe(self._arm)
+
+    def _arm(self) -> None:
+        self._handle = self._loop.call_later(self.window, self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        self._handle = None
+        self._task = asyncio.ensure_future(self.flush())
+
+    async def flush(self) -> None:
+        """Send all queued events as one frame."""
+        with self._lock:
+            events, self.pending = list(self.pending.values()), {}
+            self._armed = False
+        if not events:
+            return
+        await self.websocket.send_bytes(orjson.dumps({
+            "type": "progress_batch",
+            "events": events
+        }))
+
+    async def close(self) -> None:
+        """Flush whatever is left; call before sending the final result."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._task is not None and not self._task.done():
+            await self._task
+        await self.flush()
+
+
+async def _ws_verify_function(websocket: WebSocket, request: WsVerifyRequest) -> None:
+    """Handle the "verify_function" WebSocket action."""
+    client = get_tau_client()
+    batcher = ProgressBatcher(websocket)
+
+    # Progress callback
+    def progress_callback(progress: VerificationProgress):
+        batcher.add({
+            "type": "progress",
+            "stage": progress.stage.value,
+            "message": progress.message,
+            "progress": progress.progress,
+            "llm_round": progress.llm_round,
+            "llm_max_rounds": progress.llm_max_rounds
+        })
+
+    # Verify with streaming; progress_callback runs on the event loop
+    result = await client.verify_function_stream_async(
+        file_path=request.file_path,
+        function_name=request.function_name,
+        callback=progress_callback
+    )
+    await batcher.close()
+
+    # Send final result
+    await websocket.send_bytes(orjson.dumps({
+        "type": "result",
+        "verified": result.verified if result else False,
+        "reason": result.reason if result else "Verification failed",
+        "hash": result.hash or "" if result else ""
+    }))
+
+
+async def _ws_verify_file(websocket: WebSocket, request: WsVerifyRequest) -> None:
+    """Handle the "verify_file" WebSocket action."""
+    client = get_tau_client()
+    batcher = ProgressBatcher(websocket)
+
+    def progress_callback(progress: VerificationProgress):
+        batcher.add({
+            "type": "progress",
+            "stage": progress.stage.value,
+            "message": progress.message,
+            "progress": progress.progress
+        })
+
+    summary = await asyncio.to_thread(
+        client.verify_file,
+        file_path=request.file_path,
+        callback=progress_callback
+    )
+    await batcher.close()
+
+    # Send results
+    results = []
+    for result in summary.results:
+        results.append({
+            "name": result.name,
+            "line": result.lineno,
+            "verified": result.verified,
+            "reason": result.reason,
+            "hash": result.hash or ""
+        })
+
+    await websocket.send_bytes(orjson.dumps({
+        "type": "result",
+        "total": summary.total,
+        "passed": summary.passed,
+        "failed": summary.failed,
+        "results": results
+    }))
+
+
+_WS_HANDLERS: Dict[str, Callable[[WebSocket, WsVerifyRequest], Awaitable[None]]] = {
+    "verify_function": _ws_verify_function,
+    "verify_file": _ws_verify_file,
+}
+
+
 @app.websocket("/ws/verify")
 async def websocket_verify(websocket: WebSocket):
     """
@@ -642,10 +943,16 @@ async def websocket_verify(websocket: WebSocket):
 
     Receive:
         {
-            "type": "progress",
-            "stage": "parsing",
-            "message": "Parsing file...",
-            "progress": 0.1
+            "type": "progress_batch",
+            "events": [
+                {
+                    "type": "progress",
+                    "stage": "parsing",
+                    "message": "Parsing file...",
+                    "progress": 0.1
+                },
+                ...
+            ]
         }
         ...
         {
@@ -657,140 +964,26 @@ async def websocket_verify(websocket: WebSocket):
     await websocket.accept()
 
     try:
-        # Receive request
-        data = await websocket.receive_text()
-        request = json.loads(data)
-
-        action = request.get("action")
-        file_path = request.get("file_path")
-        function_name = request.get("function_name")
-
-        if action == "verify_function":
-            client = get_tau_client()
-
-            # Progress callback
-            async def progress_callback(progress: VerificationProgress):
-                await websocket.send_json({
-                    "type": "progress",
-                    "stage": progress.stage.value,
-                    "message": progress.message,
-                    "progress": progress.progress,
-                    "llm_round": progress.llm_round,
-                    "llm_max_rounds": progress.llm_max_rounds
-                })
-
-            # Verify with streaming
-            result = client.verify_function_stream(
-                file_path=file_path,
-                function_name=function_name,
-                callback=lambda p: asyncio.create_task(progress_callback(p))
-            )
-
-            # Automatically store proof after verification
-            print(f"[ProofStore DEBUG] result={result}, has_hash={result.hash if result else 'N/A'}")
-            if result and result.hash:
-                try:
-                    manager = get_proof_manager()
-
-                    # Read proof artifacts if available
-                    whyml_code = None
-                    lean_code = None
-
-                    print(f"[ProofStore DEBUG] whyml_file={result.whyml_file}, lean_file={result.lean_file}")
-
-                    if result.whyml_file and Path(result.whyml_file).exists():
-                        whyml_code = Path(result.whyml_file).read_text()
-                        print(f"[ProofStore DEBUG] Loaded whyml_code: {len(whyml_code)} chars")
-
-                    if result.lean_file and Path(result.lean_file).exists():
-                        lean_code = Path(result.lean_file).read_text()
-                        print(f"[ProofStore DEBUG] Loaded lean_code: {len(lean_code)} chars")
-
-                    # Prepare function info for storage
-                    print(f"[ProofStore DEBUG] python_source length: {len(result.python_source) if result.python_source else 0}")
-                    func_info = {
-                        "name": result.name,
-                        "source": result.python_source,
-                        "requires": result.specification.get("requires", ""),
-                        "ensures": result.specification.get("ensures", ""),
-                        "invariants": result.specification.get("invariants", []),
-                        "variant": result.specification.get("variant", "")
-                    }
-
-                    print(f"[ProofStore DEBUG] About to call store_proof for {result.name}")
-                    # Store proof certificate
-                    stored_hash = manager.store_proof(
-                        func_info=func_info,
-                        verified=result.verified,
-                        whyml_code=whyml_code,
-                        lean_code=lean_code,
-                        why3_output=None,  # Not captured in current flow
-                        reason=result.reason,
-                        duration=result.duration
-                    )
-
-                    print(f"[ProofStore] Stored proof for {result.name} - hash: {stored_hash[:8]}, verified: {result.verified}")
-                except Exception as e:
-                    import traceback
-                    print(f"[ProofStore] Failed to store proof: {e}")
-                    print(f"[ProofStore] Traceback: {traceback.format_exc()}")
-
-            # Send final result
-            await websocket.send_json({
-                "type": "result",
-                "verified": result.verified if result else False,
-                "reason": result.reason if result else "Verification failed",
-                "hash": result.hash or "" if result else ""
-            })
+        # Receive and validate request
+        request = WsVerifyRequest.model_validate_json(await websocket.receive_text())
 
-        elif action == "verify_file":
-            client = get_tau_client()
-
-            async def progress_callback(progress: VerificationProgress):
-                await websocket.send_json({
-                    "type": "progress",
-                    "stage": progress.stage.value,
-                    "message": progress.message,
-                    "progress": progress.progress
-                })
-
-            summary = client.verify_file(
-                file_path=file_path,
-                callback=lambda p: asyncio.create_task(progress_callback(p))
-            )
-
-            # Send results
-            results = []
-            for result in summary.results:
-                results.append({
-                    "name": result.name,
-                    "line": result.lineno,
-                    "verified": result.verified,
-                    "reason": result.reason,
-                    "hash": result.hash or ""
-                })
-
-            await websocket.send_json({
-                "type": "result",
-                "total": summary.total,
-                "passed": summary.passed,
-                "failed": summary.failed,
-                "results": results
-            })
-
-        else:
-            await websocket.send_json({
+        handler = _WS_HANDLERS.get(request.action)
+        if handler is None:
+            await websocket.send_bytes(orjson.dumps({
                 "type": "error",
-                "message": f"Unknown action: {action}"
-            })
+                "message": f"Unknown action: {request.action}"
+            }))
+            return
+
+        await handler(websocket, request)
 
     except WebSocketDisconnect:
-        print("WebSocket disconnected")
+        logger.debug("WebSocket disconnected")
     except Exception as e:
-        await websocket.send_json({
+        await websocket.send_bytes(orjson.dumps({
             "type": "error",
             "message": str(e)
-        })
+        }))
         await websocket.close()
 
 
@@ -801,6 +994,13 @@ async def websocket_verify(websocket: WebSocket):
 if __name__ == "__main__":
     import uvicorn
 
+    # TAU_LOG=DEBUG turns on proof-store/manager debug output; the %-style
+    # logger calls skip formatting entirely below the configured level
+    logging.basicConfig(
+        level=os.getenv("TAU_LOG", "INFO").upper(),
+        format="%(levelname)s:     %(name)s - %(message)s"
+    )
+
     print("=" * 60)
     print("TAU API Server")
     print("=" * 60)
@@ -809,4 +1009,16 @@ if __name__ == "__main__":
     print("WebSocket: ws://localhost:8000/ws/verify")
     print("=" * 60)
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http "auto" resolve to uvloop + httptools (installed with
+    # uvicorn[standard]) and fall back to asyncio/h11 where unavailable.
+    # Single worker: the proof index, request coalescing and response
+    # caches are in-process state that multiple workers would not share.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        backlog=2048,
+        timeout_keep_alive=30
+    )
@@ -3,7 +3,10 @@ TAU API - Unified interface for specification generation and verification
 """
 import os
 import ast
-from typing import Optional, Callable, List, Dict, Any
+import asyncio
+import re
+import functools
+from typing import Optional, Callable, List, Dict, Any, Tuple
 from pathlib import Path
 
 from tau.server.models import (
@@ -11,8 +14,72 @@ from tau.server.models import (
     FunctionInfo, VerificationStage
 )
 from tau.verify import verify_file as _verify_file_impl, VerificationResult, VerificationSummary
-from tau.llm.spec_generator import generate_specifications_sync
-from tau.parser import SafeFunctionParser
+from tau.llm.spec_generator import generate_specifications_sync, generate_specifications_batch_sync
+from tau.parser import SafeFunctionParser, has_while_loop
+
+
+# Python operators that are mistakes in WhyML specs, in the order they are reported.
+# The lookahead makes matches zero-width so overlapping tokens ("!==") all count.
+_SPEC_MISTAKES = {
+    " and ": "Use '/\\' for logical AND, not 'and'",
+    " or ": "Use '\\/' for logical OR, not 'or'",
+    "==": "Use '=' for equality, not '=='",
+    "!=": "Use '<>' for inequality, not '!='",
+}
+_SPEC_LINTER = re.compile(r"(?=( and | or |==|!=))")
+
+
+_NEWLINE = re.compile("\n")
+
+
+def _slice_lines(source: str, line_starts: Tuple[int, ...], start: int, end: int) -> str:
+    """Return lines start..end (1-based, inclusive) without the trailing newline."""
+    if end < len(line_starts):
+        return source[line_starts[start - 1]:line_starts[end] - 1]
+    return source[line_starts[start - 1]:]
+
+
+def _stage_progress(stage: str, function_name: str,
+                    llm_round: Optional[int] = None,
+                    llm_max_rounds: Optional[int] = None) -> VerificationProgress:
+    """Map a verifier stage hook call to a VerificationProgress event."""
+    if stage == VerificationStage.LLM_ROUND.value:
+        return VerificationProgress(
+            stage=VerificationStage.LLM_ROUND,
+            message=f"Generating invariants with Claude (round {llm_round}/{llm_max_rounds})...",
+            progress=0.3 + 0.6 * (llm_round - 1) / llm_max_rounds,
+            function_name=function_name,
+            llm_round=llm_round,
+            llm_max_rounds=llm_max_rounds
+        )
+    if stage == VerificationStage.GENERATING_SPECS.value:
+        return VerificationProgress(
+            stage=VerificationStage.GENERATING_SPECS,
+            message="Generating specifications with Claude...",
+            progress=0.2,
+            function_name=function_name
+        )
+    return VerificationProgress(
+        stage=VerificationStage(stage),
+        message="Running Why3 prover...",
+        progress=0.7,
+        function_name=function_name
+    )
+
+
+def _find_function(body: List[ast.stmt], name: Optional[str] = None) -> Optional[ast.FunctionDef]:
+    """Find a FunctionDef (by name, or the first one) among top-level statements and class bodies."""
+    classes = []
+    for node in body:
+        if isinstance(node, ast.FunctionDef) and (name is None or node.name == name):
+            return node
+        if isinstance(node, ast.ClassDef):
+            classes.append(node)
+    for cls in classes:
+        found = _find_function(cls.body, name)
+        if found:
+            return found
+    return None
 
 
 class TauClient:
@@ -34,16 +101,29 @@ class TauClient:
         result = api.verify_function_stream("myfile.py", "my_function", on_progress)
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-5-haiku-20241022"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-5-haiku-20241022",
+                 proof_manager=None):
         """
         Initialize TAU API.
 
         Args:
             api_key: Anthropic API key (uses ANTHROPIC_API_KEY env var if not provided)
             model: Claude model to use for spec generation
+            proof_manager: Optional ProofCertificateManager; functions whose source
+                and specs match a verified certificate are not re-proved
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
+        self.proof_manager = proof_manager
+        # Editors re-send the same source repeatedly; parse each one once.
+        # lru_cache keys on the source string itself and is thread-safe.
+        self._parse = functools.lru_cache(maxsize=128)(self._parse_source)
+
+    @staticmethod
+    def _parse_source(source: str) -> Tuple[ast.Module, Tuple[int, ...]]:
+        """Parse source, returning the tree and line start offsets (do not mutate the tree)."""
+        line_starts = (0, *(m.end() for m in _NEWLINE.finditer(source)))
+        return ast.parse(source), line_starts
 
     def extract_function_info(self, file_path: str, function_name: str) -> Optional[FunctionInfo]:
         """
@@ -57,51 +137,54 @@ class TauClient:
             FunctionInfo object or None if function not found
         """
         try:
-            with open(file_path, 'r') as f:
-                source = f.read()
-
-            tree = ast.parse(source)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and node.name == function_name:
-                    # Extract function source
-                    func_lines = source.split('\n')[node.lineno - 1:node.end_lineno]
-                    func_source = '\n'.join(func_lines)
-
-                    # Extract parameters
-                    params = []
-                    for arg in node.args.args:
-                        arg_name = arg.arg
-                        arg_type = None
-                        if arg.annotation:
-                            if isinstance(arg.annotation, ast.Name):
-                                arg_type = arg.annotation.id
-                        params.append((arg_name, arg_type))
-
-                    # Extract return type
-                    return_type = None
-                    if node.returns:
-                        if isinstance(node.returns, ast.Name):
-                            return_type = node.returns.id
-
-                    # Check for loops
-                    has_loop = any(isinstance(n, ast.While) for n in ast.walk(node))
-
-                    # Build signature
-                    param_str = ", ".join(f"{name}: {typ}" if typ else name for name, typ in params)
-                    sig = f"def {function_name}({param_str})"
-                    if return_type:
-                        sig += f" -> {return_type}"
-
-                    return FunctionInfo(
-                        name=function_name,
-                        source=func_source,
-                        line_number=node.lineno,
-                        signature=sig,
-                        has_loop=has_loop,
-                        parameters=params,
-                        return_type=return_type
-                    )
+            # Binary read + decode bypasses the text layer; normalise line
+            # endings ourselves (a no-op scan for the usual LF-only file)
+            with open(file_path, 'rb') as f:
+                source = f.read().decode('utf-8')
+            if '\r' in source:
+                source = source.replace('\r\n', '\n').replace('\r', '\n')
+
+            tree, line_starts = self._parse(source)
+
+            node = _find_function(tree.body, function_name)
+            if node:
+                # Extract function source
+                func_source = _slice_lines(source, line_starts, node.lineno, node.end_lineno)
+
+                # Extract parameters
+                params = []
+                for arg in node.args.args:
+                    arg_name = arg.arg
+                    arg_type = None
+                    if arg.annotation:
+                        if isinstance(arg.annotation, ast.Name):
+                            arg_type = arg.annotation.id
+                    params.append((arg_name, arg_type))
+
+                # Extract return type
+                return_type = None
+                if node.returns:
+                    if isinstance(node.returns, ast.Name):
+                        return_type = node.returns.id
+
+                # Check for loops
+                has_loop = has_while_loop(node)
+
+                # Build signature
+                param_str = ", ".join(f"{name}: {typ}" if typ else name for name, typ in params)
+                sig = f"def {function_name}({param_str})"
+                if return_type:
+                    sig += f" -> {return_type}"
+
+                return FunctionInfo(
+                    name=function_name,
+                    source=func_source,
+                    line_number=node.lineno,
+                    signature=sig,
+                    has_loop=has_loop,
+                    parameters=params,
+                    return_type=return_type
+                )
 
             return None
 
@@ -126,45 +209,11 @@ class TauClient:
         Returns:
             GeneratedSpecs with requires, ensures, reasoning
         """
-        # Parse function to get info
         try:
-            tree = ast.parse(function_source)
-            func_node = None
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    func_node = node
-                    break
-
-            if not func_node:
+            function_info = self._function_info(function_source)
+            if not function_info:
                 return None
 
-            # Extract parameters
-            params = []
-            for arg in func_node.args.args:
-                arg_name = arg.arg
-                arg_type = None
-                if arg.annotation and isinstance(arg.annotation, ast.Name):
-                    arg_type = arg.annotation.id
-                params.append((arg_name, arg_type))
-
-            # Return type
-            return_type = None
-            if func_node.returns and isinstance(func_node.returns, ast.Name):
-                return_type = func_node.returns.id
-
-            # Has loop?
-            has_loop = any(isinstance(n, ast.While) for n in ast.walk(func_node))
-
-            function_info = FunctionInfo(
-                name=func_node.name,
-                source=function_source,
-                line_number=func_node.lineno,
-                signature=f"def {func_node.name}(...)",
-                has_loop=has_loop,
-                parameters=params,
-                return_type=return_type
-            )
-
             # Generate specs
             return generate_specifications_sync(
                 function_info=function_info,
@@ -177,6 +226,76 @@ class TauClient:
             print(f"❌ Error generating specs: {e}")
             return None
 
+    def generate_specs_batch(
+        self,
+        function_sources: List[str],
+        context: str = ""
+    ) -> List[Optional[GeneratedSpecs]]:
+        """
+        Generate specifications for several functions, up to eight per LLM request.
+
+        Args:
+            function_sources: Python function sources
+            context: Surrounding code shared by all functions
+
+        Returns:
+            List aligned with function_sources; None where parsing or generation failed
+        """
+        results: List[Optional[GeneratedSpecs]] = [None] * len(function_sources)
+        infos, positions = [], []
+        for i, source in enumerate(function_sources):
+            try:
+                info = self._function_info(source)
+            except Exception as e:
+                print(f"❌ Error generating specs: {e}")
+                continue
+            if info:
+                infos.append(info)
+                positions.append(i)
+
+        if infos:
+            generated = generate_specifications_batch_sync(
+                infos,
+                context=context,
+                api_key=self.api_key,
+                model=self.model
+            )
+            for i, specs in zip(positions, generated):
+                results[i] = specs
+        return results
+
+    def _function_info(self, function_source: str) -> Optional[FunctionInfo]:
+        """Build FunctionInfo for the first function in function_source."""
+        tree, _ = self._parse(function_source)
+        func_node = _find_function(tree.body)
+
+        if not func_node:
+            return None
+
+        # Extract parameters
+        params = []
+        for arg in func_node.args.args:
+            arg_name = arg.arg
+            arg_type = None
+            if arg.annotation and isinstance(arg.annotation, ast.Name):
+                arg_type = arg.annotation.id
+            params.append((arg_name, arg_type))
+
+        # Return type
+        return_type = None
+        if func_node.returns and isinstance(func_node.returns, ast.Name):
+            return_type = func_node.returns.id
+
+        return FunctionInfo(
+            name=func_node.name,
+            source=function_source,
+            line_number=func_node.lineno,
+            signature=f"def {func_node.name}(...)",
+            has_loop=has_while_loop(func_node),
+            parameters=params,
+            return_type=return_type
+        )
+
     def verify_function(
         self,
         file_path: str,
@@ -196,11 +315,24 @@ class TauClient:
         Returns:
             VerificationResult with status, hash, diagnostics
         """
-        # Verify entire file and extract result for specific function
+        return self._verify_one(file_path, function_name, auto_generate_invariants, verbose)
+
+    def _verify_one(
+        self,
+        file_path: str,
+        function_name: str,
+        auto_generate_invariants: bool,
+        verbose: bool,
+        on_stage: Optional[Callable[..., None]] = None
+    ) -> Optional[VerificationResult]:
+        # Verify only the requested function, so only its certificate is stored
         summary = _verify_file_impl(
             file_path=file_path,
             api_key=self.api_key if auto_generate_invariants else None,
-            verbose=verbose
+            verbose=verbose,
+            on_stage=on_stage,
+            proof_manager=self.proof_manager,
+            function_name=function_name
         )
 
         # Find result for requested function
@@ -220,6 +352,9 @@ class TauClient:
         """
         Stream verification progress for real-time UI updates.
 
+        Stages are reported by the verifier as they actually start, so a
+        "proving" or LLM round event is not sent before its work begins.
+
         Args:
             file_path: Path to Python file
             function_name: Name of function to verify
@@ -240,39 +375,13 @@ class TauClient:
             function_name=function_name
         ))
 
-        # Stage 2: Transpiling
-        callback(VerificationProgress(
-            stage=VerificationStage.TRANSPILING,
-            message="Transpiling to WhyML...",
-            progress=0.3,
-            function_name=function_name
-        ))
+        # Stages 2-3: spec generation, LLM rounds and proving, from the verifier
+        def on_stage(stage: str, name: str, **info) -> None:
+            if name == function_name:
+                callback(_stage_progress(stage, name, **info))
 
-        # Stage 3: Proving (or LLM rounds)
-        if auto_generate_invariants:
-            # Simulate LLM rounds (in reality this would be integrated deeper)
-            callback(VerificationProgress(
-                stage=VerificationStage.LLM_ROUND,
-                message="Generating invariants with Claude...",
-                progress=0.5,
-                function_name=function_name,
-                llm_round=1,
-                llm_max_rounds=3
-            ))
-
-        callback(VerificationProgress(
-            stage=VerificationStage.PROVING,
-            message="Running Why3 prover...",
-            progress=0.7,
-            function_name=function_name
-        ))
-
-        # Actually verify
-        result = self.verify_function(
-            file_path=file_path,
-            function_name=function_name,
-            auto_generate_invariants=auto_generate_invariants,
-            verbose=False
+        result = self._verify_one(
+            file_path, function_name, auto_generate_invariants, False, on_stage
         )
 
         # Stage 4: Completed
@@ -287,6 +396,42 @@ class TauClient:
 
         return result
 
+    async def verify_function_stream_async(
+        self,
+        file_path: str,
+        function_name: str,
+        callback: Callable[[VerificationProgress], None],
+        auto_generate_invariants: bool = True
+    ) -> Optional[VerificationResult]:
+        """
+        Async variant of verify_function_stream.
+
+        Verification runs in the default executor; progress events are
+        handed back through an asyncio.Queue, so callback runs on the
+        event loop thread as each stage starts.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        def forward(progress: VerificationProgress) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, progress)
+
+        future = loop.run_in_executor(None, functools.partial(
+            self.verify_function_stream,
+            file_path, function_name, forward, auto_generate_invariants
+        ))
+        # Completion is delivered via the loop after every forwarded event
+        future.add_done_callback(lambda _: queue.put_nowait(done))
+
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            callback(item)
+
+        return await future
+
     def verify_file(
         self,
         file_path: str,
@@ -311,10 +456,17 @@ class TauClient:
                 progress=0.0
             ))
 
+        on_stage = None
+        if callback:
+            def on_stage(stage: str, name: str, **info) -> None:
+                callback(_stage_progress(stage, name, **info))
+
         summary = _verify_file_impl(
             file_path=file_path,
             api_key=self.api_key,
-            verbose=verbose
+            verbose=verbose,
+            on_stage=on_stage,
+            proof_manager=self.proof_manager
         )
 
         if callback:
@@ -351,23 +503,16 @@ class TauClient:
         if "!" not in requires and "!" not in ensures:
             # Check if function has loops - may need ! for loop vars
             try:
-                tree = ast.parse(function_source)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.While):
-                        warnings.append("Function has a loop but no '!' references in specs - did you forget to dereference loop variables?")
-                        break
+                tree, _ = self._parse(function_source)
+                if has_while_loop(tree):
+                    warnings.append("Function has a loop but no '!' references in specs - did you forget to dereference loop variables?")
             except:
                 pass
 
-        # Check for Python syntax instead of WhyML
-        if " and " in requires or " and " in ensures:
-            errors.append("Use '/\\' for logical AND, not 'and'")
-        if " or " in requires or " or " in ensures:
-            errors.append("Use '\\/' for logical OR, not 'or'")
-        if "==" in requires or "==" in ensures:
-            errors.append("Use '=' for equality, not '=='")
-        if "!=" in requires or "!=" in ensures:
-            errors.append("Use '<>' for inequality, not '!='")
+        # Check for Python syntax instead of WhyML (one scan over both specs;
+        # the newline separator cannot complete any of the tokens)
+        found = {m.group(1) for m in _SPEC_LINTER.finditer(f"{requires}\n{ensures}")}
+        errors.extend(msg for token, msg in _SPEC_MISTAKES.items() if token in found)
 
         # Check balanced parentheses
         for spec_name, spec in [("requires", requires), ("ensures", ensures)]:
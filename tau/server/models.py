@@ -1,10 +1,15 @@
 """
 Data models for TAU API
 """
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
+# These are created per function / per progress event; drop the instance
+# __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class VerificationStage(str, Enum):
     """Stages of verification process"""
@@ -17,7 +22,7 @@ class VerificationStage(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GeneratedSpecs:
     """LLM-generated specifications"""
     requires: List[str]
@@ -38,7 +43,7 @@ class GeneratedSpecs:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VerificationProgress:
     """Streaming progress updates"""
     stage: VerificationStage
@@ -61,7 +66,7 @@ class VerificationProgress:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationResult:
     """Spec validation result"""
     valid: bool
@@ -76,7 +81,7 @@ class ValidationResult:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FunctionInfo:
     """Information about a Python function"""
     name: str
@@ -0,0 +1,102 @@
+"""
+Tests for the proof endpoints of the FastAPI server
+"""
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from tau.server import app as app_module
+from tau.proofs import ProofCertificateManager
+
+
+SOURCE = '''def count_to(n: int) -> int:
+    c = 0
+    i = 0
+    while i < n:
+        c = c + 1
+        i = i + 1
+    return c
+'''
+
+STORE_BODY = {
+    "function_name": "count_to",
+    "function_source": SOURCE,
+    "requires": "n >= 0",
+    "ensures": "result = n",
+    "invariants": ["0 <= !i <= n"],
+    "variant": "n - !i",
+    "verified": True,
+}
+
+CHECK_BODY = {key: STORE_BODY[key] for key in
+              ("function_name", "function_source", "requires", "ensures", "invariants", "variant")}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Client backed by a fresh proofs dir (no lifespan, so no shared state)"""
+    monkeypatch.setattr(app_module, "proof_manager", ProofCertificateManager(str(tmp_path / "proofs")))
+    monkeypatch.setattr(app_module, "_proof_responses", {})
+    monkeypatch.setattr(app_module, "_proof_responses_version", -1)
+    return TestClient(app_module.app)
+
+
+def test_list_proofs_defaults_to_json(client):
+    """The list endpoint keeps its JSON body unless NDJSON is asked for"""
+    client.post("/api/proofs/store", json=STORE_BODY)
+
+    response = client.get("/api/proofs/list")
+    assert response.headers["content-type"].startswith("application/json")
+    body = response.json()
+    assert body["success"] is True
+    assert [p["function_name"] for p in body["proofs"]] == ["count_to"]
+
+    for response in (
+        client.get("/api/proofs/list?format=ndjson"),
+        client.get("/api/proofs/list", headers={"Accept": "application/x-ndjson"}),
+    ):
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [orjson.loads(line) for line in response.text.splitlines()]
+        assert [p["function_name"] for p in lines] == ["count_to"]
+
+
+def test_proof_batch_runs_ops_in_order(client):
+    """Mixed batch ops run in order; unknown and failing ops report errors in place"""
+    response = client.post("/api/proofs/batch", json={"requests": [
+        {"op": "check", "body": CHECK_BODY},
+        {"op": "store", "body": STORE_BODY},
+        {"op": "check", "body": CHECK_BODY},
+        {"op": "by-body", "body": {"function_name": "count_to", "function_source": SOURCE}},
+        {"op": "check", "body": {"function_name": "count_to"}},
+        {"op": "no-such-op"},
+        {"op": "stats"},
+        {"op": "list", "body": {"verified_only": True}},
+    ]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    miss, stored, hit, by_body, invalid, unknown, stats, listing = body["responses"]
+
+    assert miss["found"] is False
+    assert stored["success"] is True
+    assert hit["found"] is True and hit["hash"] == stored["hash"]
+    assert by_body["count"] == 1
+    assert "function_source" in invalid["error"]
+    assert unknown == {"error": "Unknown operation: no-such-op"}
+    assert stats["total_entries"] == 1
+    assert [p["hash"] for p in listing["proofs"]] == [stored["hash"]]
+
+
+def test_proof_stats_cache_survives_lookups_but_not_stores(client):
+    """Check-proof lookups keep the cached stats; a store refreshes them"""
+    client.post("/api/proofs/store", json=STORE_BODY)
+    assert client.get("/api/proofs/stats").json()["cache_hits"] == 0
+
+    client.post("/api/proofs/check", json=CHECK_BODY)
+    assert client.get("/api/proofs/stats").json()["cache_hits"] == 0  # within the TTL
+
+    client.post("/api/proofs/store", json={**STORE_BODY, "ensures": "result >= 0"})
+    stats = client.get("/api/proofs/stats").json()
+    assert stats["total_entries"] == 2
+    assert stats["cache_hits"] == 1
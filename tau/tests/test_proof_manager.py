@@ -0,0 +1,272 @@
+"""
+Tests for the proof certificate manager
+"""
+
+import json
+import time
+
+import pytest
+from tau.proofs import ProofCertificateManager, compute_function_hash, compute_body_hash
+from tau.proofs.manager import SCHEMA_VERSION, ZSTD_MAGIC
+
+
+SOURCE = '''def sum_to(n: int) -> int:
+    total = 0
+    for i in range(n + 1):
+        total += i
+    return total
+'''
+
+FUNC_INFO = {
+    "name": "sum_to",
+    "source": SOURCE,
+    "requires": "n >= 0",
+    "ensures": "result = n * (n + 1) div 2",
+}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ProofCertificateManager(str(tmp_path / "proofs"))
+
+
+def test_lookup_returns_private_copy(manager):
+    """Mutating a looked-up certificate must not change the cached one"""
+    manager.store_proof(FUNC_INFO, verified=True)
+
+    certificate = manager.lookup_proof(FUNC_INFO)
+    certificate["verified"] = False
+    certificate["specs"]["requires"] = "false"
+
+    again = manager.lookup_proof(FUNC_INFO)
+    assert again["verified"] is True
+    assert again["specs"]["requires"] == "n >= 0"
+
+
+def test_missing_artifact_is_not_cached(manager):
+    """A read that finds no artifact must not hide the file once it reappears"""
+    func_hash = manager.store_proof(FUNC_INFO, verified=True)
+    artifact = manager._artifact_path(func_hash)
+    data = artifact.read_bytes()
+
+    artifact.unlink()
+    manager._forget_certificate(func_hash)
+    assert manager._load_certificate(func_hash) is None
+
+    artifact.write_bytes(data)
+    assert manager._load_certificate(func_hash)["verified"] is True
+
+
+def test_store_only_evicts_its_own_hash(manager):
+    """Writing one certificate keeps the other cached certificates"""
+    kept = manager.store_proof(FUNC_INFO, verified=True)
+    manager.lookup_proof(FUNC_INFO)
+    assert kept in manager._artifact_cache
+
+    rewritten = manager.store_proof({**FUNC_INFO, "ensures": "result >= 0"}, verified=False)
+    manager.lookup_proof({**FUNC_INFO, "ensures": "result >= 0"})
+    manager.store_proof({**FUNC_INFO, "ensures": "result >= 0"}, verified=True)
+    assert kept in manager._artifact_cache
+    assert rewritten not in manager._artifact_cache
+    assert manager.lookup_proof({**FUNC_INFO, "ensures": "result >= 0"})["verified"] is True
+
+
+def test_cached_lookup_beats_uncached_read(manager):
+    """A cache hit (decode cached bytes) is faster than reading the artifact again"""
+    import timeit
+
+    func_hash = manager.store_proof(FUNC_INFO, verified=True, reason="x" * 2000)
+    manager._load_certificate(func_hash)
+
+    def cached():
+        manager._load_certificate(func_hash)
+
+    def uncached():
+        manager._forget_certificate(func_hash)
+        manager._load_certificate(func_hash)
+
+    hit = min(timeit.repeat(cached, number=500, repeat=5))
+    miss = min(timeit.repeat(uncached, number=500, repeat=5))
+    assert hit < miss
+
+
+def test_flat_store_is_migrated_to_shards(tmp_path):
+    """A pre-3.0.0 store with flat files is moved into shards once and stays readable"""
+    proofs_dir = tmp_path / "proofs"
+    func_hash = compute_function_hash(FUNC_INFO)
+    body_hash = compute_body_hash(FUNC_INFO)
+
+    for name in ("artifacts", "whyml"):
+        (proofs_dir / name).mkdir(parents=True)
+    (proofs_dir / "whyml" / f"{func_hash}.mlw").write_text("module M end")
+    (proofs_dir / "artifacts" / f"{func_hash}.json").write_text(json.dumps({
+        "hash": func_hash,
+        "body_hash": body_hash,
+        "function_name": "sum_to",
+        "verified": True,
+        "timestamp": "2025-10-30T03:45:37.710352Z",
+        "source_code": SOURCE,
+        "specs": {"requires": "n >= 0", "ensures": FUNC_INFO["ensures"], "invariants": [], "variant": ""},
+        "whyml_file": f"whyml/{func_hash}.mlw",
+    }))
+    (proofs_dir / "index.json").write_text(json.dumps({
+        "schema_version": "2.0.0",
+        "created_at": "2025-10-30T03:45:37.710352Z",
+        "last_updated": "2025-10-30T03:45:37.710352Z",
+        "entries": {func_hash: {
+            "function_name": "sum_to",
+            "verified": True,
+            "body_hash": body_hash,
+            "created_at": "2025-10-30T03:45:37.710352Z",
+            "last_accessed": "2025-10-30T03:45:37.710352Z",
+            "access_count": 0,
+            "artifact_file": f"artifacts/{func_hash}.json",
+        }},
+        "body_index": {body_hash: [func_hash]},
+        "stats": {"total_entries": 1, "cache_hits": 0, "cache_misses": 0,
+                  "cache_size_bytes": 0, "last_cleanup": "2025-10-30T03:45:37.710352Z"},
+    }))
+
+    manager = ProofCertificateManager(str(proofs_dir))
+
+    index = json.loads((proofs_dir / "index.json").read_text())
+    assert index["schema_version"] == SCHEMA_VERSION
+    assert "body_index" not in index
+    assert index["entries"][func_hash]["artifact_file"] == f"artifacts/{func_hash[:2]}/{func_hash}.json"
+    assert not (proofs_dir / "artifacts" / f"{func_hash}.json").exists()
+
+    certificate = manager.lookup_proof(FUNC_INFO)
+    assert certificate["verified"] is True
+    assert manager.read_artifact(certificate["whyml_file"]) == "module M end"
+    assert [p["hash"] for p in manager.find_proofs_by_body(FUNC_INFO)] == [func_hash]
+
+    # Opening a current store leaves its files alone
+    manager.flush()
+    mtime = (proofs_dir / "index.json").stat().st_mtime_ns
+    ProofCertificateManager(str(proofs_dir))
+    assert (proofs_dir / "index.json").stat().st_mtime_ns == mtime
+
+
+def test_lookup_with_missing_artifact_removes_entry(manager):
+    """A dangling entry is dropped from the index, body index and size stats"""
+    manager.store_proof(FUNC_INFO, verified=True, whyml_code="module M end")
+    func_hash = compute_function_hash(FUNC_INFO)
+    manager._artifact_path(func_hash).unlink()
+    manager._forget_certificate(func_hash)
+
+    assert manager.lookup_proof(FUNC_INFO) is None
+    assert func_hash not in manager.index["entries"]
+    assert manager.body_index == {}
+    assert manager.get_stats()["cache_size_bytes"] == 0
+    assert not manager._whyml_path(func_hash).exists()
+
+    reopened = ProofCertificateManager(str(manager.proofs_dir))
+    assert reopened.body_index == {}
+    assert reopened.find_proofs_by_body(FUNC_INFO) == []
+
+
+OTHER_SPECS = {**FUNC_INFO, "ensures": "result >= 0"}
+
+
+def _body_log_records(manager):
+    return [json.loads(line) for line in manager.body_index_path.read_text().splitlines()]
+
+
+def test_body_log_replays_after_invalidate(manager):
+    """Tombstones in body_index.jsonl are honoured when the log is replayed"""
+    kept = manager.store_proof(FUNC_INFO, verified=True)
+    dropped = manager.store_proof(OTHER_SPECS, verified=False)
+    body_hash = compute_body_hash(FUNC_INFO)
+    assert manager.body_index == {body_hash: [kept, dropped]}
+
+    assert manager.invalidate_proof(dropped)
+    assert _body_log_records(manager)[-1] == ["-", body_hash, dropped]
+
+    reopened = ProofCertificateManager(str(manager.proofs_dir))
+    assert reopened.body_index == {body_hash: [kept]}
+    assert [p["hash"] for p in reopened.find_proofs_by_body(FUNC_INFO)] == [kept]
+
+
+def test_body_log_torn_tail_is_dropped(manager):
+    """A partial last line (crash mid-append) is skipped and compacted away"""
+    func_hash = manager.store_proof(FUNC_INFO, verified=True)
+    body_hash = compute_body_hash(FUNC_INFO)
+    with open(manager.body_index_path, "ab") as f:
+        f.write(b'["+", "' + body_hash.encode()[:10])
+
+    reopened = ProofCertificateManager(str(manager.proofs_dir))
+    assert reopened.body_index == {body_hash: [func_hash]}
+    assert _body_log_records(reopened) == [["+", body_hash, func_hash]]
+
+    other = reopened.store_proof(OTHER_SPECS, verified=True)
+    assert ProofCertificateManager(str(manager.proofs_dir)).body_index == {body_hash: [func_hash, other]}
+
+
+def test_inline_body_index_moves_to_log(manager):
+    """A pre-3.0.0 index keeping body_index inline is moved to body_index.jsonl"""
+    func_hash = manager.store_proof(FUNC_INFO, verified=True)
+    body_hash = compute_body_hash(FUNC_INFO)
+    manager.body_index_path.unlink()
+    index = json.loads(manager.index_path.read_text())
+    index["schema_version"] = "2.0.0"
+    index["body_index"] = {body_hash: [func_hash]}
+    manager.index_path.write_text(json.dumps(index))
+
+    reopened = ProofCertificateManager(str(manager.proofs_dir))
+    assert reopened.body_index == {body_hash: [func_hash]}
+    assert _body_log_records(reopened) == [["+", body_hash, func_hash]]
+    index = json.loads(manager.index_path.read_text())
+    assert "body_index" not in index
+    assert index["schema_version"] == SCHEMA_VERSION
+
+
+def test_compressed_artifacts_round_trip(tmp_path):
+    """With compress_artifacts on, WhyML/Lean are stored as .zst and read back as text"""
+    pytest.importorskip("zstandard")
+    proofs_dir = tmp_path / "proofs"
+    proofs_dir.mkdir()
+    (proofs_dir / "config.json").write_text(json.dumps({"compress_artifacts": True}))
+    manager = ProofCertificateManager(str(proofs_dir))
+
+    whyml = "module M_sum_to\n  let sum_to (n:int) : int = 0\nend\n" * 20
+    manager.store_proof(FUNC_INFO, verified=True, whyml_code=whyml, lean_code="def sum_to := 0")
+
+    certificate = manager.lookup_proof(FUNC_INFO)
+    assert certificate["whyml_file"].endswith(".mlw.zst")
+    assert (proofs_dir / certificate["whyml_file"]).read_bytes().startswith(ZSTD_MAGIC)
+    assert manager.read_artifact(certificate["whyml_file"]) == whyml
+    assert manager.read_artifact(certificate["lean_file"]) == "def sum_to := 0"
+
+
+def test_uncompressed_artifacts_still_readable_with_compression_on(tmp_path):
+    """Files written before compress_artifacts was enabled are read as plain text"""
+    pytest.importorskip("zstandard")
+    proofs_dir = tmp_path / "proofs"
+    manager = ProofCertificateManager(str(proofs_dir))
+    manager.store_proof(FUNC_INFO, verified=True, whyml_code="module M end")
+
+    (proofs_dir / "config.json").write_text(json.dumps({"compress_artifacts": True}))
+    manager = ProofCertificateManager(str(proofs_dir))
+    certificate = manager.lookup_proof(FUNC_INFO)
+    assert certificate["whyml_file"].endswith(".mlw")
+    assert manager.read_artifact(certificate["whyml_file"]) == "module M end"
+
+
+def test_managers_are_weakly_tracked_for_exit_flush(tmp_path):
+    """The exit hook flushes live managers without keeping dropped ones alive"""
+    import gc
+    import weakref
+    from tau.proofs import manager as manager_module
+
+    manager = ProofCertificateManager(str(tmp_path / "proofs"))
+    manager.store_proof(OTHER_SPECS, verified=True)
+    manager._last_save = time.monotonic()  # so the miss below is only batched
+    manager.lookup_proof(FUNC_INFO)
+    assert json.loads(manager.index_path.read_text())["stats"]["cache_misses"] == 0
+    manager_module._flush_open_managers()
+    assert json.loads(manager.index_path.read_text())["stats"]["cache_misses"] == 1
+
+    ref = weakref.ref(manager)
+    del manager
+    gc.collect()
+    assert ref() is None
@@ -217,5 +217,36 @@ def bad(n: int) -> int:
         transpile(source, meta)
 
 
+def test_cached_transpile_returns_fresh_contracts():
+    """Repeated transpiles reuse generation but never share FunctionContract objects"""
+    from tau.core.transpiler import _freeze
+
+    source = '''
+def add(a: int, b: int) -> int:
+    return a + b
+'''
+    meta = {"add": {"requires": "true", "ensures": "result = a + b"}}
+
+    first = transpile(source, meta, base_name="test_add_cached")
+    first["functions"][0].requires = "false"
+    second = transpile(source, meta, base_name="test_add_cached")
+    assert second["functions"][0].requires == "true"
+    assert second["functions"][0] is not first["functions"][0]
+
+    # Cache keys keep the distinctions a JSON dump would erase
+    assert _freeze({"x": (1, 2)}) != _freeze({"x": [1, 2]})
+    assert _freeze({1: "a"}) != _freeze({"1": "a"})
+
+
+def test_indent_block_matches_textwrap():
+    """indent_block leaves blank and whitespace-only lines untouched, like textwrap.indent"""
+    import textwrap
+    from tau.translators.statements import indent_block
+
+    for text in ["", "a", "a\nb", "a\n\nb", "\na\n", "a\n   \nb", "  x := 1;\n\t\n  y"]:
+        assert indent_block(text) == textwrap.indent(text, "  ")
+        assert indent_block(text, 4) == textwrap.indent(text, "    ")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
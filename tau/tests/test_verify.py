@@ -0,0 +1,116 @@
+"""
+Tests for file-level verification
+"""
+
+import textwrap
+
+import pytest
+from tau.proofs import ProofCertificateManager
+from tau.verify import verify_file
+
+
+FUNCTION_TEMPLATE = '''
+@safe
+@requires("n >= 0")
+@ensures("result = n")
+@invariant("0 <= !i <= n")
+@invariant("!c = !i")
+@variant("n - !i")
+def count_to_{k}(n: int) -> int:
+    c = 0
+    i = 0
+    while i < n:
+        c = c + {step}
+        i = i + 1
+    return c
+'''
+
+
+@pytest.fixture
+def source_file(tmp_path, monkeypatch):
+    """A file of several manual-mode functions, some correct and some not"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "why_out").mkdir()  # OUTPUT_DIR is relative to the cwd
+    path = tmp_path / "counters.py"
+    path.write_text(
+        "from tau.decorators import safe, requires, ensures, invariant, variant\n"
+        + "".join(FUNCTION_TEMPLATE.format(k=k, step=1 + k % 2) for k in range(4))
+    )
+    return str(path)
+
+
+def _outcomes(summary):
+    return [(r.name, r.lineno, r.verified, r.reason, r.hash) for r in summary.results]
+
+
+def test_threaded_verify_file_matches_sequential(source_file):
+    """Verifying functions concurrently gives the same results, in the same order"""
+    sequential = verify_file(source_file, max_workers=1)
+    threaded = verify_file(source_file, max_workers=4)
+
+    assert [name for name, *_ in _outcomes(sequential)] == [f"count_to_{k}" for k in range(4)]
+    assert _outcomes(threaded) == _outcomes(sequential)
+
+
+def test_verify_file_function_name_stores_only_that_function(source_file, tmp_path):
+    """Asking for one function verifies and stores a certificate for it alone"""
+    manager = ProofCertificateManager(str(tmp_path / "proofs"))
+    summary = verify_file(source_file, proof_manager=manager, function_name="count_to_2")
+
+    assert [r.name for r in summary.results] == ["count_to_2"]
+    assert [p["function_name"] for p in manager.list_proofs()] == ["count_to_2"]
+
+
+def test_batch_specs_keep_same_named_methods_apart(tmp_path, monkeypatch):
+    """Two @safe_auto methods named alike get the specs generated for their own code"""
+    from tau.server.models import GeneratedSpecs  # before spec_generator, which it imports
+    from tau import verify as verify_module
+    from tau.llm import spec_generator
+    from tau.parser import SafeFunctionParser
+
+    path = tmp_path / "shapes.py"
+    path.write_text(
+        "from tau.decorators import safe_auto\n"
+        "class Square:\n"
+        "    @safe_auto\n"
+        "    def area(n: int) -> int:\n"
+        "        return n * n\n"
+        "class Line:\n"
+        "    @safe_auto\n"
+        "    def area(n: int) -> int:\n"
+        "        return 0\n"
+    )
+
+    def fake_batch(infos, context="", api_key=None, model=None):
+        return [GeneratedSpecs(requires=["true"], ensures=[f"source: {info.source.splitlines()[-1].strip()}"],
+                               reasoning="", confidence=1.0) for info in infos]
+
+    monkeypatch.setattr(spec_generator, "generate_specifications_batch_sync", fake_batch)
+    functions = SafeFunctionParser().parse_file(str(path))
+    specs = verify_module._batch_generate_specs(functions)
+
+    assert len(specs) == 2
+    for func_info in functions:
+        expected = func_info["source"].splitlines()[-1].strip()
+        assert specs[(func_info["name"], func_info["lineno"])].ensures == [f"source: {expected}"]
+
+
+def test_same_named_functions_get_separate_artifacts(source_file, tmp_path):
+    """Same-named methods verified together never share a WhyML file"""
+    path = tmp_path / "twins.py"
+    path.write_text(
+        "from tau.decorators import safe, requires, ensures, invariant, variant\n"
+        + "".join(
+            f"class C{k}:\n" + textwrap.indent(FUNCTION_TEMPLATE.format(k="", step=k + 1), "    ")
+            for k in range(3)
+        )
+    )
+
+    summary = verify_file(str(path), max_workers=3)
+
+    assert [r.name for r in summary.results] == ["count_to_"] * 3
+    why_files = [r.whyml_file for r in summary.results]
+    assert len(set(why_files)) == 3
+    for k, why_file in enumerate(why_files):
+        with open(why_file) as f:
+            assert f"c + {k + 1}" in f.read()
@@ -7,6 +7,11 @@ from typing import Dict, Set, Optional
 from ..core.config import BIN_OP_TO_WHY, CMP_OP_TO_WHY
 from ..core.models import ExternalFunctionContract
 
+# Operators padded once at import: one fewer piece for each node's f-string
+_BIN_OP_INFIX = {op: f" {why} " for op, why in BIN_OP_TO_WHY.items()}
+_CMP_OP_INFIX = {op: f" {why} " for op, why in CMP_OP_TO_WHY.items()}
+_BOOL_OP_SEP = {ast.And: " and ", ast.Or: " or "}
+
 
 class ExpressionTranslator(ast.NodeVisitor):
     """Translates Python expressions to WhyML syntax"""
@@ -17,7 +22,24 @@ class ExpressionTranslator(ast.NodeVisitor):
                  ref_vars: Optional[Set[str]] = None):
         self.known_functions = known_functions
         self.external_contracts = external_contracts or {}
+        # Names visit_Call may reference, merged so each call is one membership test
+        self._callable = frozenset(known_functions).union(self.external_contracts)
         self.ref_vars = ref_vars if ref_vars is not None else set()
+        # Direct type -> handler table; NodeVisitor.visit builds a "visit_" name
+        # and does a getattr for every node
+        self._dispatch = {
+            ast.Name: self.visit_Name,
+            ast.Constant: self.visit_Constant,
+            ast.UnaryOp: self.visit_UnaryOp,
+            ast.BinOp: self.visit_BinOp,
+            ast.BoolOp: self.visit_BoolOp,
+            ast.Compare: self.visit_Compare,
+            ast.IfExp: self.visit_IfExp,
+            ast.Call: self.visit_Call,
+        }
+
+    def visit(self, node: ast.AST) -> str:
+        return self._dispatch.get(type(node), self.generic_visit)(node)
 
     def visit_Name(self, node: ast.Name) -> str:
         # Dereference if it's a ref variable
@@ -45,15 +67,15 @@ class ExpressionTranslator(ast.NodeVisitor):
     def visit_BinOp(self, node: ast.BinOp) -> str:
         left = self.visit(node.left)
         right = self.visit(node.right)
-        op = BIN_OP_TO_WHY.get(type(node.op))
+        op = _BIN_OP_INFIX.get(type(node.op))
         if not op:
             raise NotImplementedError(f"Unsupported binary operator: {type(node.op).__name__}")
-        return f"({left} {op} {right})"
+        return f"({left}{op}{right})"
 
     def visit_BoolOp(self, node: ast.BoolOp) -> str:
-        op = "and" if isinstance(node.op, ast.And) else "or"
-        parts = [self.visit(v) for v in node.values]
-        return "(" + f" {op} ".join(parts) + ")"
+        # A list, not a generator: str.join builds one from a generator anyway
+        sep = _BOOL_OP_SEP[type(node.op)]
+        return f"({sep.join([self.visit(v) for v in node.values])})"
 
     def visit_Compare(self, node: ast.Compare) -> str:
         if not (len(node.ops) == 1 and len(node.comparators) == 1):
@@ -61,12 +83,12 @@ class ExpressionTranslator(ast.NodeVisitor):
 
         left = self.visit(node.left)
         right = self.visit(node.comparators[0])
-        op = CMP_OP_TO_WHY.get(type(node.ops[0]))
+        op = _CMP_OP_INFIX.get(type(node.ops[0]))
 
         if not op:
             raise NotImplementedError(f"Unsupported comparison: {type(node.ops[0]).__name__}")
 
-        return f"({left} {op} {right})"
+        return f"({left}{op}{right})"
 
     def visit_IfExp(self, node: ast.IfExp) -> str:
         test = self.visit(node.test)
@@ -79,7 +101,7 @@ class ExpressionTranslator(ast.NodeVisitor):
             raise NotImplementedError("Only simple function calls supported")
 
         callee = node.func.id
-        if callee not in self.known_functions and callee not in self.external_contracts:
+        if callee not in self._callable:
             raise NotImplementedError(f"Unknown function: {callee}")
 
         args = ", ".join(self.visit(arg) for arg in node.args)
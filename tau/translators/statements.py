@@ -3,15 +3,15 @@ Python statement translation to WhyML imperative code
 """
 
 import ast
-import textwrap
 from typing import List, Set, Optional
 from ..core.models import LoopContract
 from .expressions import ExpressionTranslator
 
 
 def indent_block(text: str, spaces: int = 2) -> str:
-    """Indent a block of text"""
-    return textwrap.indent(text, " " * spaces)
+    """Indent every line of a block of text that isn't blank (as textwrap.indent)"""
+    prefix = " " * spaces
+    return "\n".join(prefix + line if line.strip() else line for line in text.split("\n"))
 
 
 def translate_statements(statements: List[ast.stmt],
@@ -27,7 +27,39 @@ def translate_statements(statements: List[ast.stmt],
     - While loops with invariants/variants
     - Return statements
     """
-    lines = []
+    out: List[str] = []
+    _emit_statements(statements, expr_translator, loop_contract, ref_vars, out, "")
+    return "\n".join(out)
+
+
+def _emit(out: List[str], indent: str, text: str) -> None:
+    """Append text at the given indent (whitespace-only lines stay unindented)"""
+    if "\n" in text:
+        out.extend(indent + line if line.strip() else line for line in text.split("\n"))
+    else:
+        out.append(indent + text if text.strip() else text)
+
+
+def _emit_block(statements: List[ast.stmt],
+                expr_translator: ExpressionTranslator,
+                loop_contract: Optional[LoopContract],
+                ref_vars: Set[str],
+                out: List[str],
+                indent: str) -> None:
+    """Emit a nested block one level deeper; an empty block still takes one (blank) line"""
+    size = len(out)
+    _emit_statements(statements, expr_translator, loop_contract, ref_vars, out, indent + "  ")
+    if len(out) == size:
+        out.append("")
+
+
+def _emit_statements(statements: List[ast.stmt],
+                     expr_translator: ExpressionTranslator,
+                     loop_contract: Optional[LoopContract],
+                     ref_vars: Set[str],
+                     out: List[str],
+                     indent: str) -> None:
+    """Append the WhyML lines for statements to out, each prefixed by indent"""
     used_while = False
 
     for stmt in statements:
@@ -40,28 +72,23 @@ def translate_statements(statements: List[ast.stmt],
 
             if var_name in ref_vars:
                 # Update existing ref
-                lines.append(f"{var_name} := {value};")
+                _emit(out, indent, f"{var_name} := {value};")
             else:
                 # Create new ref
-                lines.append(f"let {var_name} = ref {value} in")
+                _emit(out, indent, f"let {var_name} = ref {value} in")
                 ref_vars.add(var_name)
 
         elif isinstance(stmt, ast.If):
             condition = expr_translator.visit(stmt.test)
-            then_body = translate_statements(stmt.body, expr_translator, loop_contract, ref_vars)
+            _emit(out, indent, f"if {condition} then (")
+            _emit_block(stmt.body, expr_translator, loop_contract, ref_vars, out, indent)
 
             if not stmt.orelse:
                 raise NotImplementedError("Both if/else branches required")
 
-            else_body = translate_statements(stmt.orelse, expr_translator, loop_contract, ref_vars)
-
-            lines.append(
-                f"if {condition} then (\n"
-                f"{indent_block(then_body)}\n"
-                f") else (\n"
-                f"{indent_block(else_body)}\n"
-                f")"
-            )
+            _emit(out, indent, ") else (")
+            _emit_block(stmt.orelse, expr_translator, loop_contract, ref_vars, out, indent)
+            _emit(out, indent, ")")
 
         elif isinstance(stmt, ast.While):
             if used_while:
@@ -69,26 +96,23 @@ def translate_statements(statements: List[ast.stmt],
             used_while = True
 
             condition = expr_translator.visit(stmt.test)
-            body = translate_statements(stmt.body, expr_translator, loop_contract, ref_vars)
 
             # Build while loop with correct WhyML syntax: while cond do invariant/variant body done
-            loop_parts = [f"while {condition} do"]
+            _emit(out, indent, f"while {condition} do")
 
             # Add invariants and variant AFTER do
             if loop_contract:
                 for invariant in loop_contract.invariants:
-                    loop_parts.append(f"  invariant {{ {invariant} }}")
+                    _emit(out, indent, f"  invariant {{ {invariant} }}")
                 if loop_contract.variant:
-                    loop_parts.append(f"  variant {{ {loop_contract.variant} }}")
+                    _emit(out, indent, f"  variant {{ {loop_contract.variant} }}")
 
             # Add body and done
-            loop_parts.append(indent_block(body))
-            loop_parts.append("done;")
-
-            lines.append("\n".join(loop_parts))
+            _emit_block(stmt.body, expr_translator, loop_contract, ref_vars, out, indent)
+            _emit(out, indent, "done;")
 
         elif isinstance(stmt, ast.Return):
-            lines.append(expr_translator.visit(stmt.value))
+            _emit(out, indent, expr_translator.visit(stmt.value))
 
         elif isinstance(stmt, ast.Expr):
             # Skip standalone expressions (like docstrings)
@@ -102,5 +126,3 @@ def translate_statements(statements: List[ast.stmt],
 
         else:
             raise NotImplementedError(f"Unsupported statement: {type(stmt).__name__}")
-
-    return "\n".join(lines)
@@ -2,13 +2,41 @@
 File I/O utilities
 """
 
+import itertools
 import os
-import uuid
 from typing import Optional, Tuple
 
 OUTPUT_DIR = "./why_out"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Unique names: pid + per-process sequence, no urandom read per call
+_BUNDLE_SEQ = itertools.count()
+
+# Characters encoded per write; bounds the bytes copy held alongside the source
+WRITE_CHUNK = 1 << 16
+
+
+def _write_text(path: str, text: str) -> None:
+    # Binary writes skip the text layer's newline translation; encoding in
+    # chunks avoids a second full-size copy of large modules
+    with open(path, "wb") as f:
+        if len(text) <= WRITE_CHUNK:
+            f.write(text.encode("utf-8"))
+            return
+        for start in range(0, len(text), WRITE_CHUNK):
+            f.write(text[start:start + WRITE_CHUNK].encode("utf-8"))
+
+
+def unique_base_name(name: str) -> str:
+    """
+    name with a pid + sequence suffix, unique across threads and processes.
+
+    Verifications run concurrently (thread pools, server requests), so
+    artifacts named after the function alone could be overwritten by a
+    same-named function from another file while Why3 is still reading them.
+    """
+    return f"{name}_{os.getpid():x}_{next(_BUNDLE_SEQ):x}"
+
 
 def save_artifacts(whyml_source: str,
                   lean_source: str,
@@ -24,14 +52,11 @@ def save_artifacts(whyml_source: str,
     Returns:
         (why_file_path, lean_file_path)
     """
-    base = base_name or f"bundle_{uuid.uuid4().hex[:8]}"
+    base = base_name or unique_base_name("bundle")
     why_path = os.path.join(OUTPUT_DIR, f"{base}.why")
     lean_path = os.path.join(OUTPUT_DIR, f"{base}.lean")
 
-    with open(why_path, "w", encoding="utf-8") as f:
-        f.write(whyml_source)
-
-    with open(lean_path, "w", encoding="utf-8") as f:
-        f.write(lean_source)
+    _write_text(why_path, whyml_source)
+    _write_text(lean_path, lean_source)
 
     return why_path, lean_path
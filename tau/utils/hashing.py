@@ -3,9 +3,46 @@ Cryptographic hashing utilities for TAU verification artifacts.
 Provides integrity checking for Python source, WhyML code, and Lean code.
 """
 
+import functools
 import hashlib
+import os
+import threading
 from typing import Optional
 
+# hashlib's sha256 is OpenSSL's, which already dispatches to SHA-NI (or
+# AVX2/SSSE3) at runtime; bind the constructor once for the hot paths.
+_sha256 = hashlib.sha256
+
+# Per-thread read buffer for hash_file, reused across calls
+_READ_BUFFER_SIZE = 256 * 1024
+_buffers = threading.local()
+
+
+def _read_buffer() -> bytearray:
+    buf = getattr(_buffers, "buf", None)
+    if buf is None:
+        buf = _buffers.buf = bytearray(_READ_BUFFER_SIZE)
+    return buf
+
+
+@functools.lru_cache(maxsize=1024)
+def _hash_file_cached(file_path: str, mtime_ns: int, size: int, inode: int) -> str:
+    """Digest of a file; the stat fields in the key invalidate it when the file changes"""
+    # Hash the bytes as stored: no decode/re-encode round trip
+    h = _sha256()
+    buf = _read_buffer()
+    view = memoryview(buf)
+    with open(file_path, 'rb') as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            if buf.find(b'\r', 0, n) != -1:
+                # Text mode hashed CRLF/CR as LF; keep those digests stable
+                return ArtifactHasher._hash_text_file(file_path)
+            h.update(view[:n])
+    return h.hexdigest()
+
 
 class ArtifactHasher:
     """
@@ -23,7 +60,7 @@ class ArtifactHasher:
         Returns:
             Hexadecimal hash string
         """
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return _sha256(content.encode('utf-8')).hexdigest()
 
     @staticmethod
     def hash_file(file_path: str) -> Optional[str]:
@@ -37,12 +74,17 @@ class ArtifactHasher:
             Hexadecimal hash string, or None if file doesn't exist
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return ArtifactHasher.hash_string(content)
+            st = os.stat(file_path)
+            return _hash_file_cached(file_path, st.st_mtime_ns, st.st_size, st.st_ino)
         except (FileNotFoundError, IOError):
             return None
 
+    @staticmethod
+    def _hash_text_file(file_path: str) -> str:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return ArtifactHasher.hash_string(content)
+
     @staticmethod
     def compute_combined_hash(python_hash: str, whyml_hash: str, lean_hash: str) -> str:
         """
@@ -58,7 +100,7 @@ class ArtifactHasher:
             Combined SHA-256 hash
         """
         combined = f"{python_hash}|{whyml_hash}|{lean_hash}"
-        return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+        return _sha256(combined.encode('utf-8')).hexdigest()
 
     @staticmethod
     def verify_integrity(json_result: dict,
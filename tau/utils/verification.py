@@ -2,10 +2,19 @@
 Why3 verification utilities
 """
 
+import re
 import subprocess
 from typing import Optional
 
 
+_PROVER_VALID = re.compile(r"Prover result is:\s*Valid")
+
+
+def proof_succeeded(output: Optional[str]) -> bool:
+    """Whether Why3 output reports a valid proof (one scan of the output)."""
+    return bool(output) and _PROVER_VALID.search(output) is not None
+
+
 def verify_with_why3(why_file: str,
                      prover: str = "Alt-Ergo,2.6.2",
                      timeout: int = 10) -> str:
@@ -34,3 +43,4 @@ def verify_with_why3(why_file: str,
         return f"Why3 verification timed out after {timeout}s"
     except Exception as e:
         return f"Why3 error: {e}"
+
@@ -3,19 +3,46 @@ TAU verification library.
 Main API for verifying @safe decorated functions.
 """
 
+import functools
+import multiprocessing
+import os
+import sys
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
-from tau.parser import SafeFunctionParser
+from tau.parser import SafeFunctionParser, has_while_loop
 from tau.llm import feedback_loop_transpile
 from tau import transpile
 from tau.output import VerificationJSONFormatter
 from tau.proofs import compute_function_hash
+from tau.utils.files import unique_base_name
+from tau.utils.verification import proof_succeeded
+
+
+# verify_file runs functions on worker threads; keep each verbose line whole
+_print_lock = threading.Lock()
+
+# Manual-mode batches at least this large are spread over forked processes
+PROCESS_POOL_MIN_FUNCTIONS = 32
+
+
+def _log(*args, **kwargs) -> None:
+    with _print_lock:
+        print(*args, **kwargs)
 
 
 class VerificationResult:
     """Result of verifying a single function"""
 
+    # One instance per verified function; no per-instance __dict__
+    __slots__ = (
+        "name", "lineno", "verified", "reason", "used_llm", "bug_type",
+        "python_source", "duration", "specification", "llm_info",
+        "bug_analysis", "whyml_file", "lean_file", "hash", "cached",
+    )
+
     def __init__(self, name: str, lineno: int):
         self.name = name
         self.lineno = lineno
@@ -32,6 +59,7 @@ class VerificationResult:
         self.whyml_file = None
         self.lean_file = None
         self.hash = None  # Function semantic hash
+        self.cached = False  # Reused a stored proof certificate
 
     def __repr__(self):
         status = "✅ PASS" if self.verified else "❌ FAIL"
@@ -41,12 +69,17 @@ class VerificationResult:
 class VerificationSummary:
     """Summary of verification results for a file"""
 
+    __slots__ = ("filename", "results", "_passed")
+
     def __init__(self, filename: str):
         self.filename = filename
         self.results: List[VerificationResult] = []
+        self._passed = 0  # Counted in add_result
 
     def add_result(self, result: VerificationResult):
         self.results.append(result)
+        if result.verified:
+            self._passed += 1
 
     @property
     def total(self) -> int:
@@ -54,42 +87,179 @@ class VerificationSummary:
 
     @property
     def passed(self) -> int:
-        return sum(1 for r in self.results if r.verified)
+        return self._passed
 
     @property
     def failed(self) -> int:
-        return sum(1 for r in self.results if not r.verified)
+        return len(self.results) - self._passed
 
     def print_summary(self):
-        """Print formatted summary"""
-        print("\n" + "=" * 80)
-        print(f"VERIFICATION SUMMARY: {self.filename}")
-        print("=" * 80)
+        """Print formatted summary (built in memory, written once)"""
+        rule = "=" * 80
+        lines = ["", rule, f"VERIFICATION SUMMARY: {self.filename}", rule]
 
         if not self.results:
-            print("⚠️  No @safe decorated functions found")
+            lines.append("⚠️  No @safe decorated functions found")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
 
-        print(f"\nTotal functions analyzed: {self.total}")
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        print(f"Success rate: {self.passed}/{self.total} ({100*self.passed//self.total if self.total > 0 else 0}%)")
-
-        print("\n" + "-" * 80)
-        print("DETAILED RESULTS")
-        print("-" * 80)
+        total = self.total
+        passed = self.passed
+        lines += [
+            "",
+            f"Total functions analyzed: {total}",
+            f"✅ Passed: {passed}",
+            f"❌ Failed: {total - passed}",
+            f"Success rate: {passed}/{total} ({100 * passed // total}%)",
+            "",
+            "-" * 80,
+            "DETAILED RESULTS",
+            "-" * 80,
+        ]
 
         for result in self.results:
-            print(f"\n{result}")
+            lines.append("")
+            lines.append(str(result))
             if result.used_llm:
-                print(f"   🤖 Used LLM to generate invariants")
+                lines.append("   🤖 Used LLM to generate invariants")
             if result.bug_type:
-                print(f"   🐛 Bug type: {result.bug_type}")
+                lines.append(f"   🐛 Bug type: {result.bug_type}")
+
+        lines += ["", rule]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _auto_function_info(func_info: Dict[str, Any]):
+    """Build the FunctionInfo that spec generation expects from parser output"""
+    import ast
+    from tau.server.models import FunctionInfo
+
+    func_node = func_info.get("ast") or ast.parse(func_info["source"]).body[0]
+
+    # Extract parameters
+    params = [(arg.arg, None) for arg in func_node.args.args]
+
+    # Extract return type if annotated
+    return_type = None
+    if func_node.returns and isinstance(func_node.returns, ast.Name):
+        return_type = func_node.returns.id
+
+    # Check if has loop (statement blocks only, stops at the first While)
+    has_loop = has_while_loop(func_node)
+
+    # Build signature
+    param_str = ", ".join(f"{name}" for name, _ in params)
+    sig = f"def {func_info['name']}({param_str})"
+    if return_type:
+        sig += f" -> {return_type}"
+
+    return FunctionInfo(
+        name=func_info["name"],
+        source=func_info["source"],
+        line_number=func_info.get("lineno", 1),
+        signature=sig,
+        has_loop=has_loop,
+        parameters=params,
+        return_type=return_type
+    )
+
 
-        print("\n" + "=" * 80)
+def _batch_generate_specs(functions: List[Dict[str, Any]], api_key: str = None,
+                          on_stage: Optional[Callable[..., None]] = None) -> Dict[Tuple[str, int], Any]:
+    """
+    Generate specs for all @safe_auto functions with batched LLM requests.
 
+    Keyed by (name, lineno): methods of different classes can share a name.
+    """
+    infos = []
+    keys = []
+    for func_info in functions:
+        if func_info.get("auto_mode", False):
+            try:
+                infos.append(_auto_function_info(func_info))
+                keys.append((func_info["name"], func_info["lineno"]))
+            except Exception:
+                # verify_function reports the parse error for this one
+                pass
+    if len(infos) < 2:
+        return {}
+
+    if on_stage:
+        for info in infos:
+            on_stage("generating_specs", info.name)
+
+    from tau.llm.spec_generator import generate_specifications_batch_sync
+
+    generated = generate_specifications_batch_sync(infos, api_key=api_key)
+    return {key: specs for key, specs in zip(keys, generated) if specs is not None}
+
+
+def _hash_info(func_info: Dict[str, Any], specification: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields compute_function_hash keys a function + specs on"""
+    return {
+        "name": func_info["name"],
+        "source": func_info["source"],
+        "requires": specification.get("requires", ""),
+        "ensures": specification.get("ensures", ""),
+        "invariants": specification.get("invariants", []),
+        "variant": specification.get("variant", ""),
+        "ast": func_info.get("ast")
+    }
+
+
+def _cached_result(result: VerificationResult, certificate: Dict[str, Any],
+                   proofs_dir) -> VerificationResult:
+    """Fill a result from a stored proof certificate"""
+    result.verified = True
+    result.cached = True
+    result.reason = certificate.get("reason") or "Proof succeeded with provided invariants"
+    result.hash = certificate["hash"]
+    if certificate.get("whyml_file"):
+        result.whyml_file = str(proofs_dir / certificate["whyml_file"])
+    if certificate.get("lean_file"):
+        result.lean_file = str(proofs_dir / certificate["lean_file"])
+    return result
 
-def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: bool = False) -> VerificationResult:
+
+def _use_processes(functions: List[Dict[str, Any]], on_stage, proof_manager) -> bool:
+    """
+    Whether verify_file should fork worker processes instead of threads.
+
+    Only for large batches that never call the LLM (every function has
+    invariants or a variant, none is @safe_auto), with nothing unpicklable
+    to hand the workers, and only while this process has a single thread,
+    since forking a threaded process (e.g. the server) is unsafe.
+    """
+    return (
+        len(functions) >= PROCESS_POOL_MIN_FUNCTIONS
+        and on_stage is None
+        and proof_manager is None
+        and threading.active_count() == 1
+        and "fork" in multiprocessing.get_all_start_methods()
+        and all(
+            not f.get("auto_mode", False)
+            and (f["invariants"] is not None or f["variant"] is not None)
+            for f in functions
+        )
+    )
+
+
+def _store_result(proof_manager, func_info: Dict[str, Any], result: VerificationResult) -> None:
+    """Store a proof certificate for a finished result; artifacts are copied by path"""
+    proof_manager.store_proof(
+        func_info=_hash_info(func_info, result.specification),
+        verified=result.verified,
+        whyml_path=result.whyml_file,
+        lean_path=result.lean_file,
+        reason=result.reason,
+        duration=result.duration
+    )
+
+
+def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: bool = False,
+                    generated_specs=None,
+                    on_stage: Optional[Callable[..., None]] = None,
+                    proof_manager=None) -> VerificationResult:
     """
     Verify a single function.
 
@@ -97,6 +267,12 @@ def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: boo
         func_info: Dict with function info from parser
         api_key: Optional Anthropic API key
         verbose: Print verbose output
+        generated_specs: Pre-generated GeneratedSpecs for @safe_auto functions
+        on_stage: Optional progress hook, called as on_stage(stage, function_name, **info)
+            when a stage actually starts ("generating_specs", "llm_round", "proving")
+        proof_manager: Optional ProofCertificateManager; a function with provided
+            invariants whose hash already has a verified certificate is not re-proved,
+            and every new result is stored as a certificate
 
     Returns:
         VerificationResult
@@ -113,54 +289,23 @@ def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: boo
         # If auto_mode, generate requires/ensures specs first
         if auto_mode:
             if verbose:
-                print(f"\n🤖 Auto-generating specifications for {func_info['name']}...")
+                _log(f"\n🤖 Auto-generating specifications for {func_info['name']}...")
 
-            # Import spec generator and models
             from tau.llm.spec_generator import generate_specifications_sync
-            from tau.server.models import FunctionInfo
-            import ast
 
-            # Parse function to extract details for FunctionInfo
             try:
-                tree = ast.parse(func_info["source"])
-                func_node = tree.body[0]
-
-                # Extract parameters
-                params = [(arg.arg, None) for arg in func_node.args.args]
-
-                # Extract return type if annotated
-                return_type = None
-                if func_node.returns and isinstance(func_node.returns, ast.Name):
-                    return_type = func_node.returns.id
-
-                # Check if has loop
-                has_loop = any(isinstance(n, ast.While) for n in ast.walk(func_node))
-
-                # Build signature
-                param_str = ", ".join(f"{name}" for name, _ in params)
-                sig = f"def {func_info['name']}({param_str})"
-                if return_type:
-                    sig += f" -> {return_type}"
-
-                # Create FunctionInfo object
-                function_info_obj = FunctionInfo(
-                    name=func_info["name"],
-                    source=func_info["source"],
-                    line_number=func_info.get("lineno", 1),
-                    signature=sig,
-                    has_loop=has_loop,
-                    parameters=params,
-                    return_type=return_type
-                )
-
-                # Generate specs from function info
-                spec_result = generate_specifications_sync(
-                    function_info=function_info_obj,
-                    api_key=api_key
-                )
+                # Reuse specs already generated in a batch by verify_file
+                spec_result = generated_specs
+                if spec_result is None:
+                    if on_stage:
+                        on_stage("generating_specs", func_info["name"])
+                    spec_result = generate_specifications_sync(
+                        function_info=_auto_function_info(func_info),
+                        api_key=api_key
+                    )
             except Exception as e:
                 if verbose:
-                    print(f"   Error parsing function: {e}")
+                    _log(f"   Error parsing function: {e}")
                 result.verified = False
                 result.reason = f"Auto-generation failed: Could not parse function - {e}"
                 result.duration = time.time() - start_time
@@ -172,12 +317,12 @@ def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: boo
                 func_info["ensures"] = " /\\ ".join(spec_result.ensures)
 
                 if verbose:
-                    print(f"   Generated @requires: {func_info['requires']}")
-                    print(f"   Generated @ensures: {func_info['ensures']}")
+                    _log(f"   Generated @requires: {func_info['requires']}")
+                    _log(f"   Generated @ensures: {func_info['ensures']}")
                     if spec_result.confidence:
-                        print(f"   Confidence: {spec_result.confidence}")
+                        _log(f"   Confidence: {spec_result.confidence}")
                     if spec_result.reasoning:
-                        print(f"   Reasoning: {spec_result.reasoning}")
+                        _log(f"   Reasoning: {spec_result.reasoning}")
             else:
                 # Spec generation failed
                 result.verified = False
@@ -204,7 +349,7 @@ def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: boo
         # If invariants/variant provided, use manual mode
         if func_info["invariants"] is not None or func_info["variant"] is not None:
             if verbose:
-                print(f"\n📝 Verifying {func_info['name']} (manual mode)...")
+                _log(f"\n📝 Verifying {func_info['name']} (manual mode)...")
 
             # Add invariants and variant
             if func_info["invariants"]:
@@ -212,11 +357,23 @@ def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: boo
             if func_info["variant"]:
                 meta[func_info["name"]]["variant"] = func_info["variant"]
 
+            # Same source + specs as an already proved function: reuse its certificate
+            if proof_manager is not None:
+                certificate = proof_manager.lookup_proof(_hash_info(func_info, result.specification))
+                if certificate and certificate.get("verified"):
+                    if verbose:
+                        _log(f"   Reusing stored proof {certificate['hash'][:8]}")
+                    _cached_result(result, certificate, proof_manager.proofs_dir)
+                    result.duration = time.time() - start_time
+                    return result
+
             # Transpile and verify
+            if on_stage:
+                on_stage("proving", func_info["name"])
             transpile_result = transpile(
                 func_info["source"],
                 meta,
-                base_name=func_info["name"],
+                base_name=unique_base_name(func_info["name"]),
                 verify=True
             )
 
@@ -226,7 +383,7 @@ def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: boo
 
             verification_output = transpile_result.get("verification", "")
 
-            if "Valid" in verification_output and "Prover result is: Valid" in verification_output:
+            if proof_succeeded(verification_output):
                 result.verified = True
                 result.reason = "Proof succeeded with provided invariants"
             else:
@@ -236,17 +393,23 @@ def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: boo
         else:
             # Use LLM feedback loop
             if verbose:
-                print(f"\n🤖 Verifying {func_info['name']} (LLM mode)...")
+                _log(f"\n🤖 Verifying {func_info['name']} (LLM mode)...")
 
             result.used_llm = True
 
+            on_round = None
+            if on_stage:
+                def on_round(round_num: int, max_rounds: int) -> None:
+                    on_stage("llm_round", func_info["name"], llm_round=round_num, llm_max_rounds=max_rounds)
+
             transpile_result = feedback_loop_transpile(
                 func_info["source"],
                 meta,
                 target_function=func_info["name"],
                 max_rounds=3,
                 api_key=api_key,
-                verify=True
+                verify=True,
+                on_round=on_round
             )
 
             # Capture file paths
@@ -295,26 +458,30 @@ def verify_function(func_info: Dict[str, Any], api_key: str = None, verbose: boo
 
     # Compute semantic hash of function + specs
     try:
-        hash_info = {
-            "name": func_info["name"],
-            "source": func_info["source"],
-            "requires": result.specification.get("requires", ""),
-            "ensures": result.specification.get("ensures", ""),
-            "invariants": result.specification.get("invariants", []),
-            "variant": result.specification.get("variant", "")
-        }
-        result.hash = compute_function_hash(hash_info)
+        result.hash = compute_function_hash(_hash_info(func_info, result.specification))
     except Exception as e:
         if verbose:
-            print(f"⚠️  Could not compute hash: {e}")
+            _log(f"⚠️  Could not compute hash: {e}")
         result.hash = None
 
+    # Store the certificate so the next run with the same source + specs can reuse it
+    if proof_manager is not None and result.hash:
+        try:
+            _store_result(proof_manager, func_info, result)
+        except Exception as e:
+            if verbose:
+                _log(f"⚠️  Could not store proof: {e}")
+
     return result
 
 
 def verify_file(file_path: str, api_key: str = None, verbose: bool = False,
                 json_output: Optional[str] = None, prover: str = "Alt-Ergo,2.6.2",
-                timeout: int = 10) -> VerificationSummary:
+                timeout: int = 10,
+                on_stage: Optional[Callable[..., None]] = None,
+                max_workers: Optional[int] = None,
+                proof_manager=None,
+                function_name: Optional[str] = None) -> VerificationSummary:
     """
     Verify all @safe decorated functions in a file.
 
@@ -325,6 +492,10 @@ def verify_file(file_path: str, api_key: str = None, verbose: bool = False,
         json_output: Optional path to save JSON output
         prover: Why3 prover to use
         timeout: Prover timeout in seconds
+        on_stage: Optional progress hook passed to verify_function
+        max_workers: Functions verified concurrently (default: CPU count; 1 = sequential)
+        proof_manager: Optional ProofCertificateManager to reuse and store proofs in
+        function_name: Only verify (and store a certificate for) this function
 
     Returns:
         VerificationSummary
@@ -334,13 +505,39 @@ def verify_file(file_path: str, api_key: str = None, verbose: bool = False,
     # Parse file
     parser = SafeFunctionParser()
     functions = parser.parse_file(file_path)
+    if function_name is not None:
+        functions = [f for f in functions if f["name"] == function_name]
 
     if verbose:
         print(f"\n🔍 Found {len(functions)} @safe decorated functions")
 
-    # Verify each function
-    for func_info in functions:
-        result = verify_function(func_info, api_key, verbose)
+    # Generate specs for @safe_auto functions up front, several per LLM request
+    batch_specs = _batch_generate_specs(functions, api_key, on_stage)
+
+    def verify_one(func_info: Dict[str, Any]) -> VerificationResult:
+        return verify_function(func_info, api_key, verbose,
+                               generated_specs=batch_specs.get((func_info["name"], func_info["lineno"])),
+                               on_stage=on_stage, proof_manager=proof_manager)
+
+    # Verify each function. The work is waiting on Why3 subprocesses and LLM
+    # calls, which release the GIL, so threads run the provers in parallel.
+    # Large manual-mode batches also spend real CPU time transpiling and
+    # hashing, so those go to forked processes instead. Each call writes its
+    # own uniquely named artifacts, so same-named functions can run together.
+    workers = min(len(functions), max_workers or os.cpu_count() or 1)
+    if workers > 1:
+        if _use_processes(functions, on_stage, proof_manager):
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("fork")) as executor:
+                results = list(executor.map(functools.partial(verify_function, verbose=verbose),
+                                            functions, chunksize=4))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(verify_one, functions))
+    else:
+        results = [verify_one(func_info) for func_info in functions]
+
+    for result in results:
         summary.add_result(result)
 
     # Generate JSON output if requested
@@ -86,19 +86,21 @@ else:
 print("\n[Test 4] Verification with Streaming")
 print("-" * 60)
 
+STAGE_EMOJI = {
+    "parsing": "📖",
+    "transpiling": "🔄",
+    "generating_specs": "🤖",
+    "llm_round": "🔄",
+    "proving": "🔍",
+    "completed": "✅",
+    "failed": "❌"
+}
+# Progress bars for 0..20 filled cells, built once
+BARS = [("█" * i).ljust(20, "░") for i in range(21)]
+
 def progress_callback(progress):
-    stage_emoji = {
-        "parsing": "📖",
-        "transpiling": "🔄",
-        "generating_specs": "🤖",
-        "llm_round": "🔄",
-        "proving": "🔍",
-        "completed": "✅",
-        "failed": "❌"
-    }
-    emoji = stage_emoji.get(progress.stage, "⚙️")
-    progress_bar = int(progress.progress * 20)
-    bar = "█" * progress_bar + "░" * (20 - progress_bar)
+    emoji = STAGE_EMOJI.get(progress.stage, "⚙️")
+    bar = BARS[int(progress.progress * 20)]
 
     msg = f"{emoji} [{bar}] {progress.progress * 100:5.1f}% | {progress.message}"
     if progress.llm_round:
@@ -6,12 +6,16 @@ Test the full proof certificate integration:
 3. Test the API endpoints
 """
 
+import orjson
 import requests
-import json
 
 
 BASE_URL = "http://localhost:8000"
 
+# One keep-alive connection for the health check and the batch request
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
+
 
 def test_proof_workflow():
     """Test the complete proof workflow."""
@@ -22,17 +26,14 @@ def test_proof_workflow():
     # Test 1: Check server is running
     print("\n1. Checking server health...")
     try:
-        response = requests.get(f"{BASE_URL}/")
-        health = response.json()
+        response = SESSION.get(f"{BASE_URL}/")
+        health = orjson.loads(response.content)
         print(f"   ✅ Server is running: {health['status']}")
     except Exception as e:
         print(f"   ❌ Server is not running: {e}")
         print("   Please start server with: python3 -m tau.server.app")
         return
 
-    # Test 2: Store a proof certificate
-    print("\n2. Storing a proof certificate...")
-
     function_source = """def count_to(n: int) -> int:
     c = 0
     i = 0
@@ -41,21 +42,55 @@ def test_proof_workflow():
         i = i + 1
     return c"""
 
-    store_request = {
+    check_request = {
         "function_name": "count_to",
         "function_source": function_source,
         "requires": "n >= 0",
         "ensures": "result = n",
         "invariants": ["0 <= !i <= n", "!c = !i"],
-        "variant": "n - !i",
+        "variant": "n - !i"
+    }
+
+    # Storing sends the same function + specs plus the proof artifacts
+    store_request = {
+        **check_request,
         "verified": True,
         "whyml_code": "let count_to (n: int) : int = ...",
         "lean_code": "def count_to (n : Int) : Int := ...",
         "why3_output": "Verification successful - all goals proved"
     }
 
-    response = requests.post(f"{BASE_URL}/api/proofs/store", json=store_request)
-    result = response.json()
+    different_function = {
+        "function_name": "unknown_func",
+        "function_source": "def unknown_func(x: int) -> int:\n    return x * 2",
+        "requires": "",
+        "ensures": ""
+    }
+
+    # Same function, different formatting
+    reformatted_source = """def count_to(n: int) -> int:
+        c = 0
+        i = 0
+        while i < n:
+            c = c + 1
+            i = i + 1
+        return c"""  # Extra indentation
+
+    reformatted_check = {**check_request, "function_source": reformatted_source}
+
+    # Tests 2-7 go to the server as one batch, encoded once; operations run in order
+    response = SESSION.post(f"{BASE_URL}/api/proofs/batch", data=orjson.dumps({"requests": [
+        {"op": "store", "body": store_request},
+        {"op": "check", "body": check_request},
+        {"op": "check", "body": different_function},
+        {"op": "stats"},
+        {"op": "list"},
+        {"op": "check", "body": reformatted_check},
+    ]}))
+    result, proof_check, miss_check, stats, listing, reformatted = orjson.loads(response.content)["responses"]
+
+    # Test 2: Store a proof certificate
+    print("\n2. Storing a proof certificate...")
 
     if result.get("success"):
         func_hash = result["hash"]
@@ -67,18 +102,6 @@ def test_proof_workflow():
     # Test 3: Check the proof exists
     print("\n3. Checking if proof can be retrieved...")
 
-    check_request = {
-        "function_name": "count_to",
-        "function_source": function_source,
-        "requires": "n >= 0",
-        "ensures": "result = n",
-        "invariants": ["0 <= !i <= n", "!c = !i"],
-        "variant": "n - !i"
-    }
-
-    response = requests.post(f"{BASE_URL}/api/proofs/check", json=check_request)
-    proof_check = response.json()
-
     if proof_check.get("found"):
         print(f"   ✅ Found cached proof!")
         print(f"      Hash: #{proof_check['hash'][:8]}")
@@ -91,17 +114,7 @@ def test_proof_workflow():
     # Test 4: Test cache miss with different function
     print("\n4. Testing cache miss with different function...")
 
-    different_function = {
-        "function_name": "unknown_func",
-        "function_source": "def unknown_func(x: int) -> int:\n    return x * 2",
-        "requires": "",
-        "ensures": ""
-    }
-
-    response = requests.post(f"{BASE_URL}/api/proofs/check", json=different_function)
-    proof_check = response.json()
-
-    if not proof_check.get("found"):
+    if not miss_check.get("found"):
         print(f"   ✅ Correctly returned cache miss")
     else:
         print(f"   ❌ Should not have found a proof for unknown function")
@@ -109,9 +122,6 @@ def test_proof_workflow():
     # Test 5: Get cache statistics
     print("\n5. Getting cache statistics...")
 
-    response = requests.get(f"{BASE_URL}/api/proofs/stats")
-    stats = response.json()
-
     print(f"   Total entries: {stats['total_entries']}")
     print(f"   Cache hits: {stats['cache_hits']}")
     print(f"   Cache misses: {stats['cache_misses']}")
@@ -120,11 +130,8 @@ def test_proof_workflow():
     # Test 6: List all proofs
     print("\n6. Listing all proofs...")
 
-    response = requests.get(f"{BASE_URL}/api/proofs/list")
-    result = response.json()
-
-    if result.get("success"):
-        proofs = result["proofs"]
+    if listing.get("success"):
+        proofs = listing["proofs"]
         print(f"   Found {len(proofs)} proof(s):")
         for proof in proofs:
             status = "✅" if proof["verified"] else "❌"
@@ -135,30 +142,9 @@ def test_proof_workflow():
     # Test 7: Verify that hash is stable across formatting
     print("\n7. Testing hash stability across formatting changes...")
 
-    # Same function, different formatting
-    reformatted_source = """def count_to(n: int) -> int:
-        c = 0
-        i = 0
-        while i < n:
-            c = c + 1
-            i = i + 1
-        return c"""  # Extra indentation
-
-    reformatted_check = {
-        "function_name": "count_to",
-        "function_source": reformatted_source,
-        "requires": "n >= 0",
-        "ensures": "result = n",
-        "invariants": ["0 <= !i <= n", "!c = !i"],
-        "variant": "n - !i"
-    }
-
-    response = requests.post(f"{BASE_URL}/api/proofs/check", json=reformatted_check)
-    proof_check = response.json()
-
-    if proof_check.get("found") and proof_check["hash"] == func_hash:
+    if reformatted.get("found") and reformatted["hash"] == func_hash:
         print(f"   ✅ Hash is stable - found same proof despite formatting changes!")
-        print(f"      Hash: #{proof_check['hash'][:8]}")
+        print(f"      Hash: #{reformatted['hash'][:8]}")
     else:
         print(f"   ❌ Hash changed with formatting (should be stable)")
 
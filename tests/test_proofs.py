@@ -3,29 +3,39 @@
 Test the proof certificate system.
 """
 
-from tau.proofs import ProofCertificateManager, compute_function_hash
+from types import MappingProxyType
 
+from tau.proofs import ProofCertificateManager, compute_function_hash
 
-def test_hash_computation():
-    """Test that hashing works and is stable."""
-    print("=" * 60)
-    print("Test 1: Hash Computation")
-    print("=" * 60)
 
-    func_info = {
-        "name": "count_to",
-        "source": """def count_to(n: int) -> int:
+# Shared read-only fixture; tests take a dict() copy
+COUNT_TO_FUNC_INFO = MappingProxyType({
+    "name": "count_to",
+    "source": """def count_to(n: int) -> int:
     c = 0
     i = 0
     while i < n:
         c = c + 1
         i = i + 1
     return c""",
-        "requires": "n >= 0",
-        "ensures": "result = n",
-        "invariants": ["0 <= !i <= n", "!c = !i"],
-        "variant": "n - !i"
-    }
+    "requires": "n >= 0",
+    "ensures": "result = n",
+    "invariants": ["0 <= !i <= n", "!c = !i"],
+    "variant": "n - !i"
+})
+
+
+# One manager (index loaded once) shared by every test
+MANAGER = ProofCertificateManager()
+
+
+def test_hash_computation():
+    """Test that hashing works and is stable."""
+    print("=" * 60)
+    print("Test 1: Hash Computation")
+    print("=" * 60)
+
+    func_info = dict(COUNT_TO_FUNC_INFO)
 
     hash1 = compute_function_hash(func_info)
     print(f"Hash: {hash1}")
@@ -67,22 +77,9 @@ def test_proof_storage_and_lookup():
     print("Test 2: Proof Storage and Lookup")
     print("=" * 60)
 
-    manager = ProofCertificateManager()
+    manager = MANAGER
 
-    func_info = {
-        "name": "count_to",
-        "source": """def count_to(n: int) -> int:
-    c = 0
-    i = 0
-    while i < n:
-        c = c + 1
-        i = i + 1
-    return c""",
-        "requires": "n >= 0",
-        "ensures": "result = n",
-        "invariants": ["0 <= !i <= n", "!c = !i"],
-        "variant": "n - !i"
-    }
+    func_info = dict(COUNT_TO_FUNC_INFO)
 
     # Store a proof
     print("Storing proof certificate...")
@@ -123,7 +120,7 @@ def test_cache_miss():
     print("Test 3: Cache Miss")
     print("=" * 60)
 
-    manager = ProofCertificateManager()
+    manager = MANAGER
 
     func_info = {
         "name": "unknown_function",
@@ -151,7 +148,7 @@ def test_list_proofs():
     print("Test 4: List Proofs")
     print("=" * 60)
 
-    manager = ProofCertificateManager()
+    manager = MANAGER
 
     proofs = manager.list_proofs()
     print(f"Total proofs: {len(proofs)}")
@@ -11,11 +11,14 @@ print("=" * 60)
 
 base_url = "http://localhost:8000"
 
+# One keep-alive connection for all requests below
+session = requests.Session()
+
 # Test 1: Health Check
 print("\n[1] Health Check")
 print("-" * 60)
 try:
-    response = requests.get(f"{base_url}/")
+    response = session.get(f"{base_url}/")
     data = response.json()
     print(f"✅ Status: {data['status']}")
     print(f"   Version: {data['version']}")
@@ -27,7 +30,7 @@ except Exception as e:
 print("\n[2] Verify Function")
 print("-" * 60)
 try:
-    response = requests.post(
+    response = session.post(
         f"{base_url}/api/verify-function",
         json={
             "file_path": "examples/safe_functions.py",
@@ -54,7 +57,7 @@ except Exception as e:
 print("\n[3] Verify File")
 print("-" * 60)
 try:
-    response = requests.post(
+    response = session.post(
         f"{base_url}/api/verify-file",
         json={"file_path": "examples/safe_functions.py"}
     )
@@ -79,7 +82,7 @@ except Exception as e:
 print("\n[4] Spec Generation (requires ANTHROPIC_API_KEY)")
 print("-" * 60)
 try:
-    response = requests.post(
+    response = session.post(
         f"{base_url}/api/generate-specs",
         json={
             "function_source": """def multiply(x: int, n: int) -> int: